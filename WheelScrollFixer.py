@@ -8,26 +8,40 @@ import os
 import subprocess
 import logging
 import json
-import configparser
+import math
 import ctypes
 import ast
+import copy
 import threading
+import queue
+import collections
 import time
 import tempfile
 import atexit
+import gc
 import platform
 from ctypes import wintypes
 
-import psutil
+try:
+    import orjson # Optional: faster settings load/save when available
+except ImportError:
+    orjson = None
+
 import win32gui
 import win32process
 import win32con
 from PyQt5 import QtWidgets, QtGui, QtCore
 from app_context import AppContext
-from gui import SettingsDialog, HelpDialog, AboutDialog
+from gui import SettingsDialog
 from utils import get_foreground_process_name
 from localization import translator
 
+# Process/launch paths, resolved once (os.path.abspath is a GetFullPathName call on Windows)
+_FROZEN = getattr(sys, 'frozen', False)
+_EXE_PATH = os.path.abspath(sys.executable)
+_SCRIPT_PATH = os.path.abspath(__file__)
+_BASE_PATH = os.path.dirname(_EXE_PATH) if _FROZEN else os.path.dirname(_SCRIPT_PATH)
+
 class MSLLHOOKSTRUCT(ctypes.Structure):
     _fields_ = [
         ("pt", wintypes.POINT),
@@ -40,28 +54,77 @@ class MSLLHOOKSTRUCT(ctypes.Structure):
 # =========================
 # Modern JSON Settings Class
 # =========================
+# use_last_error makes ctypes capture GetLastError right after each kernel32 call
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_MoveFileExW = _kernel32.MoveFileExW
+_MoveFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+_MoveFileExW.restype = wintypes.BOOL
+MOVEFILE_REPLACE_EXISTING = 0x1
+MOVEFILE_WRITE_THROUGH = 0x8
+
+def _replace_durable(src, dst):
+    """
+    os.replace that doesn't return until the rename is on disk. Windows can't fsync a
+    directory, so the rename goes through MoveFileExW with MOVEFILE_WRITE_THROUGH there.
+    """
+    if sys.platform == 'win32':
+        if not _MoveFileExW(src, dst, MOVEFILE_REPLACE_EXISTING | MOVEFILE_WRITE_THROUGH):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return
+    os.replace(src, dst)
+
+# The config folder lives next to the exe/script
+_CONFIG_DIR = os.path.join(_BASE_PATH, "config")
+
 class JsonSettings:
     """A modern JSON file settings manager with INI migration support."""
-    def __init__(self, app_name):
-        """Initializes the settings, loading from JSON (or migrating from INI)."""
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-        else:
-            base_path = os.path.dirname(os.path.abspath(__file__))
+    __slots__ = ('config_dir', 'json_path', 'ini_path', 'data', '_flat', '_typed', '_loaded',
+                 '_dirty', '_unsaved', '_sync_lock', '_data_lock', '_timer_lock', '_sync_timer')
 
-        self.config_dir = os.path.join(base_path, "config")
+    def __init__(self, app_name):
+        """Initializes the settings; the file is read (or migrated from INI) on first access."""
+        self.config_dir = _CONFIG_DIR
+        os.makedirs(self.config_dir, exist_ok=True)
         self.json_path = os.path.join(self.config_dir, f"{app_name}.json")
         self.ini_path = os.path.join(self.config_dir, f"{app_name}.ini")
         
         self.data = {}
-        self._load_settings()
+        self._dirty = set() # keys changed via set_value since the last pop_dirty()
+        self._unsaved = False # True while self.data differs from the file on disk
+        self._sync_lock = threading.Lock() # one writer at a time; held across the disk I/O
+        self._data_lock = threading.Lock() # guards data while the writer snapshots it
+        self._timer_lock = threading.Lock() # guards _sync_timer only, so arming it never waits on a write
+        self._sync_timer = None
+        self._flat = {}
+        self._typed = {} # key -> {type: coerced value}; dropped for a key on set_value
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        """Reads the settings file the first time a value is read or written."""
+        if not self._loaded:
+            self._loaded = True # set first: migration calls sync() while loading
+            self._load_settings()
+            self._rebuild_flat()
+
+    def _rebuild_flat(self):
+        """
+        Builds the flat key -> value view used by value(). Keys match what callers pass:
+        bare option names for the 'General' section, 'Section/option' otherwise.
+        """
+        self._flat = {
+            (opt if sec == 'General' else f"{sec}/{opt}"): v
+            for sec, opts in self.data.items() if isinstance(opts, dict)
+            for opt, v in opts.items()
+        }
+        self._typed = {}
 
     def _load_settings(self):
         """Loads settings from JSON. Migrates from INI if JSON is missing."""
         if os.path.exists(self.json_path):
             try:
-                with open(self.json_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+                with open(self.json_path, 'rb') as f:
+                    raw = f.read()
+                self.data = orjson.loads(raw) if orjson else json.loads(raw)
             except Exception as e:
                 logging.error(f"Failed to load JSON settings: {e}")
                 self.data = {}
@@ -69,31 +132,74 @@ class JsonSettings:
             logging.info("Migrating legacy INI settings to JSON...")
             self._migrate_from_ini()
 
+    def _read_ini(self):
+        """
+        Reads the legacy INI file in one pass into {section: {option: raw_str}}.
+        Only the subset configparser accepted from our own writer is needed:
+        [section] headers, key = value / key: value pairs and ;/# comment lines.
+        Option names are lower-cased, matching configparser's default optionxform.
+        """
+        sections = {}
+        current = None
+        with open(self.ini_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in '#;':
+                    continue
+                if line[0] == '[' and line[-1] == ']':
+                    current = sections.setdefault(line[1:-1].strip(), {})
+                    continue
+                if current is None:
+                    continue
+                eq, colon = line.find('='), line.find(':')
+                sep = eq if colon < 0 or (0 <= eq < colon) else colon
+                if sep <= 0:
+                    continue
+                current[line[:sep].strip().lower()] = line[sep + 1:].strip()
+        return sections
+
+    @staticmethod
+    def _has_non_finite(value):
+        """True if value holds a NaN/Infinity float, which strict JSON (and orjson) can't read back."""
+        if isinstance(value, float):
+            return not math.isfinite(value)
+        if isinstance(value, (list, tuple)):
+            return any(JsonSettings._has_non_finite(v) for v in value)
+        if isinstance(value, dict):
+            return any(JsonSettings._has_non_finite(v) for v in value.values())
+        return False
+
+    @staticmethod
+    def _coerce(val):
+        """
+        Converts a raw INI string to a typed value. json.loads handles numbers and
+        JSON-style lists/dicts; ast.literal_eval is only reached for legacy repr()
+        values (single quotes, tuples). Anything else, including values holding
+        NaN/Infinity, stays a string.
+        """
+        low = val.lower()
+        if low in ('true', 'false'):
+            return low == 'true'
+        try:
+            result = json.loads(val)
+        except ValueError:
+            try:
+                result = ast.literal_eval(val)
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                return val
+        return val if JsonSettings._has_non_finite(result) else result
+
     def _migrate_from_ini(self):
         """Migrates data from the legacy INI file to the new JSON format."""
         try:
-            config = configparser.ConfigParser()
-            config.read(self.ini_path)
-            
             new_data = {}
-            for section in config.sections():
+            for section, options in self._read_ini().items():
                 new_data[section] = {}
-                for key, val in config.items(section):
-                    # Attempt to convert types using ast.literal_eval
-                    try:
-                        # Only eval if it looks like a structure or number
-                        if val.lower() in ['true', 'false']:
-                            val_conv = (val.lower() == 'true')
-                        else:
-                            try:
-                                val_conv = ast.literal_eval(val)
-                            except (ValueError, SyntaxError):
-                                val_conv = val
-                        new_data[section][key] = val_conv
-                    except Exception:
-                        new_data[section][key] = val
+                for key, val in options.items():
+                    new_data[section][key] = self._coerce(val)
             
             self.data = new_data
+            self._unsaved = True
             self.sync() # Save as JSON
             
             # Rename old INI to .bak
@@ -107,56 +213,174 @@ class JsonSettings:
 
     def value(self, key, default=None, type=None):
         """Retrieves a value from the settings."""
-        section, option = self._parse_key(key)
-        val = self.data.get(section, {}).get(option, default)
+        if not self._loaded:
+            self._ensure_loaded()
+        typed = self._typed.get(key)
+        if typed is not None and type in typed:
+            result = typed[type]
+            # Containers go out as copies: edits made in place by callers would race the writer thread
+            return copy.deepcopy(result) if isinstance(result, (list, dict)) else result
+        val = self._flat.get(key)
+        if val is None and '/' in key:
+            # Spelled-out 'General/option' keys are stored under the bare option name
+            section, option = self._parse_key(key)
+            val = self.data.get(section, {}).get(option)
+            cacheable = False
+        else:
+            cacheable = True
         
         # JSON usually preserves types, but we ensure basic consistency if requested
         if val is None:
             return default
             
         if type == int:
-            return int(val)
+            result = int(val)
         elif type == float:
-            return float(val)
+            result = float(val)
         elif type == bool:
             if isinstance(val, str):
-                return val.lower() == 'true'
-            return bool(val)
+                result = val.lower() == 'true'
+            else:
+                result = bool(val)
         elif type == list:
-            return val if isinstance(val, list) else []
+            result = val if isinstance(val, list) else []
         elif type == dict:
-            return val if isinstance(val, dict) else {}
-            
-        return val
+            result = val if isinstance(val, dict) else {}
+        else:
+            result = val
+
+        # Stored values only change through set_value, which drops this entry
+        if cacheable:
+            self._typed.setdefault(key, {})[type] = result
+        return copy.deepcopy(result) if isinstance(result, (list, dict)) else result
 
     def set_value(self, key, value):
-        """Sets a value in the settings."""
+        """Sets a value in the settings; unchanged scalars don't mark anything dirty."""
+        if self._has_non_finite(value):
+            raise ValueError(f"Non-finite float in setting {key!r}: {value!r}")
+        self._ensure_loaded()
         section, option = self._parse_key(key)
-        if section not in self.data:
-            self.data[section] = {}
-        self.data[section][option] = value
-
-    def _parse_key(self, key):
+        is_container = isinstance(value, (list, dict))
+        with self._data_lock:
+            opts = self.data.setdefault(section, {})
+            # Lists/dicts may have been mutated in place by the caller, so always count them
+            if not is_container and option in opts and opts[option] == value:
+                return
+            if is_container:
+                value = copy.deepcopy(value) # Stored privately; the caller keeps its own object
+            opts[option] = value
+            flat_key = option if section == 'General' else f"{section}/{option}"
+            self._flat[flat_key] = value
+            self._typed.pop(flat_key, None)
+            self._dirty.add(key)
+            self._unsaved = True
+
+    def pop_dirty(self):
+        """Returns the keys set since the last call and clears the record."""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    @staticmethod
+    def _parse_key(key):
         """Parses a key into a section and option."""
-        if '/' in key:
-            parts = key.split('/')
-            return parts[0], parts[1]
-        return 'General', key
+        section, sep, option = key.partition('/')
+        return (section, option) if sep else ('General', key)
+
+    SYNC_DEBOUNCE = 0.25 # seconds; request_sync calls within this window share one write
+
+    def request_sync(self):
+        """Schedules a debounced sync(); rapid successive changes cost a single safe write."""
+        with self._timer_lock:
+            if self._sync_timer:
+                self._sync_timer.cancel()
+            self._sync_timer = threading.Timer(self.SYNC_DEBOUNCE, self.sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def flush(self):
+        """Cancels any pending debounced write and syncs immediately."""
+        with self._timer_lock:
+            if self._sync_timer:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+        self.sync()
 
     def sync(self):
         """Saves the settings to the JSON file atomically."""
-        os.makedirs(os.path.dirname(self.json_path), exist_ok=True)
-        temp_file_path = self.json_path + '.tmp'
+        with self._sync_lock:
+            self._write_json()
+
+    def _write_json(self):
+        """Writes a snapshot of self.data through a temp file and os.replace; caller holds _sync_lock."""
+        config_dir = self.config_dir
+        # Unique per writer so concurrent syncs can't trip over each other's O_EXCL temp file
+        temp_file_path = f"{self.json_path}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            with open(temp_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4)
-            os.replace(temp_file_path, self.json_path)
+            # Serialize a private copy: the GUI thread keeps editing self.data during the write.
+            # _unsaved is cleared with the snapshot, so a set_value landing mid-write re-marks it.
+            with self._data_lock:
+                if not self._unsaved:
+                    return
+                self._unsaved = False
+                snapshot = copy.deepcopy(self.data)
+            # Serialize in memory first so the temp file gets one write() instead of
+            # json.dump's many small chunked writes. The fallback matches orjson's layout
+            # (2-space indent, raw UTF-8) so the file looks the same either way.
+            if orjson:
+                payload = memoryview(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+            else:
+                payload = memoryview(json.dumps(snapshot, indent=2, ensure_ascii=False).encode('utf-8'))
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+            fd = os.open(temp_file_path, flags, 0o644)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            _replace_durable(temp_file_path, self.json_path)
+            # Persist the rename itself on POSIX; on Windows MOVEFILE_WRITE_THROUGH covers it
+            if hasattr(os, 'O_DIRECTORY'):
+                dfd = os.open(config_dir, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dfd)
+                finally:
+                    os.close(dfd)
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
+            with self._data_lock:
+                self._unsaved = True # Nothing reached disk; keep the changes for the next sync
             if os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
 
 # gui/single_instance.py
+# Prototyped once at import so the kernel32 calls skip ctypes' per-call argument guessing.
+_CreateMutexW = _kernel32.CreateMutexW
+_CreateMutexW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.LPCWSTR]
+_CreateMutexW.restype = wintypes.HANDLE
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+_OpenProcess = _kernel32.OpenProcess
+_OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_OpenProcess.restype = wintypes.HANDLE
+_WaitForSingleObject = _kernel32.WaitForSingleObject
+_WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_WaitForSingleObject.restype = wintypes.DWORD
+ERROR_ALREADY_EXISTS = 183
+_CreateEventW = _kernel32.CreateEventW
+_CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+_CreateEventW.restype = wintypes.HANDLE
+_SetEvent = _kernel32.SetEvent
+_SetEvent.argtypes = [wintypes.HANDLE]
+_SetEvent.restype = wintypes.BOOL
+SYNCHRONIZE = 0x00100000
+INFINITE = 0xFFFFFFFF
+WAIT_OBJECT_0 = 0
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+PM_REMOVE = 0x0001
+
 def bring_window_to_front(window_title):
     """Finds a window by its title and brings it to the foreground."""
     try:
@@ -176,15 +400,19 @@ class SingleInstance:
     """
     def __init__(self, app_name, window_title):
         self.mutex = None
-        self.mutex_name = r"Global\{app_name}_Mutex"
+        self.mutex_name = f"Global\\{app_name}_Mutex"
         self.window_title = window_title
 
     def acquire_lock(self):
         """
-        Attempts to acquire the mutex. If it fails, another instance is running.
+        Attempts to create the named mutex. If it already exists, another instance is running.
+        Ownership is never requested: holding an open handle is enough to keep the name alive.
         """
-        self.mutex = ctypes.windll.kernel32.CreateMutexW(None, True, self.mutex_name)
-        if ctypes.windll.kernel32.GetLastError() == 183: # ERROR_ALREADY_EXISTS
+        self.mutex = _CreateMutexW(None, False, self.mutex_name)
+        if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            # We only opened the other instance's mutex; drop our handle before bailing out
+            _CloseHandle(self.mutex)
+            self.mutex = None
             print("Another instance is already running. Bringing it to the front.")
             bring_window_to_front(self.window_title)
             return False
@@ -193,7 +421,7 @@ class SingleInstance:
     def release_lock(self):
         """Releases the mutex."""
         if self.mutex:
-            ctypes.windll.kernel32.CloseHandle(self.mutex)
+            _CloseHandle(self.mutex)
             self.mutex = None
 
     def __del__(self):
@@ -204,6 +432,8 @@ class SingleInstance:
 # ===============
 class Settings(JsonSettings):
     """Manages application-specific settings using JSON backend."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("WheelScrollFixer")
 
@@ -284,12 +514,12 @@ def configure_startup(enable: bool):
     run_key = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
     name = "ScrollLockApp"
     
-    if getattr(sys, 'frozen', False):
+    if _FROZEN:
         # If frozen (exe), point to the executable itself
-        path = f'"{os.path.abspath(sys.executable)}"'
+        path = f'"{_EXE_PATH}"'
     else:
         # If script, point to python interpreter + script
-        path = f'"{os.path.abspath(sys.executable)}" "{os.path.abspath(__file__)}"'
+        path = f'"{_EXE_PATH}" "{_SCRIPT_PATH}"'
 
     try:
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, run_key, 0, winreg.KEY_WRITE) as key:
@@ -308,9 +538,35 @@ def configure_startup(enable: bool):
 # =======================
 # Low-Level Mouse Hooker
 # =======================
-from utils import get_foreground_process_name
+
+NS_PER_SEC = 1_000_000_000
+
+# Per-event hook tracing. A plain constant so hook_proc pays a single global load
+# instead of logger lookups; set WSF_DEBUG=1 when diagnosing the filter logic.
+_DEBUG_HOOK = bool(os.environ.get("WSF_DEBUG"))
+
+# Immutable hook settings snapshot; field access is a tuple slot read instead of a dict probe
+_HookConfig = collections.namedtuple('_HookConfig', (
+    'interval', 'interval_ns', 'blacklist', 'app_profiles', 'enabled', 'threshold',
+    'strict', 'min_reversal', 'min_reversal_ns', 'smart', 'per_app', 'default_pair',
+))
+
+def _to_ns(seconds):
+    """Converts a settings interval in seconds to integer nanoseconds."""
+    return int(round(seconds * NS_PER_SEC))
 
 class MouseHook:
+    # Smart momentum: reversals faster than these gaps raise the threshold by +2 / +1 (ns);
+    # hook_proc indexes a (2, 1, 0) table by how many of the two bounds the gap reaches
+    SMART_VERY_FAST_NS = 100_000_000
+    SMART_FAST_NS = 200_000_000
+    # Window in which a wheel burst reuses the last foreground name outright (ns)
+    FOREGROUND_BURST_NS = 50_000_000
+    # Settings keys the derived per-app profile table depends on
+    _PROFILE_INPUTS = frozenset(('app_profiles', 'block_interval', 'direction_change_threshold'))
+    # Settings keys (other than 'enabled') that feed the hook config snapshot
+    _SNAPSHOT_INPUTS = _PROFILE_INPUTS | frozenset(('blacklist', 'strict_mode', 'min_reversal_interval', 'smart_momentum'))
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self.user32 = ctypes.windll.user32
@@ -320,44 +576,93 @@ class MouseHook:
         self.thread_id = None
         self.calibration_callback = None
         
-        # Caching for process name
-        self.last_hwnd = None
+        # Last raw foreground name and its lower-cased form (see _resolve_foreground)
+        self.last_app_raw = None
         self.last_app_name = None
+        self._fg_expiry_ns = 0 # last_app_name is reused without any Win32 call until then
 
         # Logic State
         self.pending_start_dir = None
         self.last_dir = None
-        self.last_time = 0.0
+        self.last_time = 0 # perf_counter_ns of the last accepted/pending tick
         self._consecutive_opposite_events = 0
         self.blocked_up = 0
         self.blocked_down = 0
 
+        # Deferred hook-side work (debug records, blocked counters) drained by a worker thread
+        self._evt_q = queue.SimpleQueue()
+        self._evt_worker = None
+
+        # Kernel events the hook thread's pump waits on next to its message queue:
+        # manual-reset shutdown, and auto-reset "re-check whether the hook should be installed"
+        self._shutdown_evt = _CreateEventW(None, True, False, None)
+        self._sync_evt = _CreateEventW(None, False, False, None)
+
         # Thread-Safe Config Snapshot (Atomic Swap)
-        self.config_snapshot = {}
+        self.config_snapshot = None
         self.reload_settings()
 
     def set_calibration_callback(self, callback):
         """Sets a callback function to receive raw scroll events for calibration."""
         self.calibration_callback = callback
+        # Calibration needs raw events even while filtering is disabled
+        self._request_hook_sync()
+
+    def _wants_hook(self):
+        """The hook is only installed while filtering is enabled or calibration is running."""
+        cfg = self.config_snapshot
+        return bool((cfg and cfg.enabled) or self.calibration_callback)
+
+    def _request_hook_sync(self):
+        """
+        Asks the hook thread to (un)install the hook; SetWindowsHookEx must run on that thread.
+        An event (unlike a thread message) can't be lost before the thread's queue exists.
+        """
+        _SetEvent(self._sync_evt)
+
+    def _sync_hook(self):
+        """Installs or removes the hook on the hook thread to match _wants_hook()."""
+        if self._wants_hook():
+            if not self.hook_id:
+                # For WH_MOUSE_LL, hMod should be NULL (0) if the hook proc is in the same process/thread context
+                self.hook_id = self.user32.SetWindowsHookExW(
+                    win32con.WH_MOUSE_LL,
+                    self.hook_cb,
+                    0,
+                    0,
+                )
+                if not self.hook_id:
+                    error_code = self.kernel32.GetLastError()
+                    logging.error(f"CRITICAL ERROR: Failed to install mouse hook. Error Code: {error_code}")
+                else:
+                    logging.info(f"SUCCESS: Mouse hook installed. Hook ID: {self.hook_id}")
+        elif self.hook_id:
+            self.user32.UnhookWindowsHookEx(self.hook_id)
+            self.hook_id = None
+            logging.info("Mouse hook removed (filtering disabled).")
 
     def reload_settings(self, update_tray_icon_callback=None, update_font_callback=None):
         """
-        Loads all settings into a dictionary and atomically swaps the reference.
+        Loads all settings into a _HookConfig snapshot and atomically swaps the reference.
         This ensures the hook thread always sees a consistent state without locks.
+        Time windows are precomputed as integer nanoseconds so the hook only does int compares.
+        Only the parts whose settings changed since the previous reload are rebuilt; an
+        enable toggle just patches that one field.
         """
-        new_config = {
-            'interval': self.settings.get_interval(),
-            'blacklist': [x.lower() for x in self.settings.get_blacklist()],
-            'app_profiles': self.settings.get_app_profiles(),
-            'enabled': self.settings.get_enabled(),
-            'threshold': self.settings.get_direction_change_threshold(),
-            'strict': self.settings.get_strict_mode(),
-            'min_reversal': self.settings.get_min_reversal_interval(),
-            'smart': self.settings.get_smart_momentum(),
-        }
+        dirty = self.settings.pop_dirty()
+        old = self.config_snapshot
+        if old is not None and dirty.isdisjoint(self._SNAPSHOT_INPUTS):
+            # Tray toggle / non-hook settings: patch the one field instead of re-reading all
+            new_config = old._replace(enabled=self.settings.get_enabled()) if 'enabled' in dirty else old
+        else:
+            new_config = self._build_config(old, dirty)
         
         # Atomic assignment in Python (GIL ensures this is safe for single ref swap)
         self.config_snapshot = new_config
+
+        # While disabled the hook is removed entirely so wheel input never enters this process
+        if bool(old and old.enabled) != new_config.enabled:
+            self._request_hook_sync()
         
         self._consecutive_opposite_events = 0
         
@@ -366,223 +671,345 @@ class MouseHook:
         if update_font_callback:
             update_font_callback()
 
-    def _get_foreground_app_name(self):
-        """Efficiently retrieves the foreground app name using caching."""
+    def _build_config(self, old, dirty):
+        """
+        Reads the hook-relevant settings into a new _HookConfig. The blacklist set and
+        profile table are reused from old unless their inputs are in dirty.
+        """
+        interval = self.settings.get_interval()
+        threshold = self.settings.get_direction_change_threshold()
+        min_reversal = self.settings.get_min_reversal_interval()
+
+        if not old or 'blacklist' in dirty:
+            blacklist = frozenset(x.lower() for x in self.settings.get_blacklist())
+        else:
+            blacklist = old.blacklist
+
+        if not old or not dirty.isdisjoint(self._PROFILE_INPUTS):
+            # Keys lower-cased to match the lower-cased foreground name from _resolve_foreground;
+            # values are (interval_ns, threshold) with the global defaults filled in.
+            app_profiles = {
+                k.lower(): (_to_ns(p.get('interval', interval)), p.get('threshold', threshold))
+                for k, p in self.settings.get_app_profiles().items()
+            }
+        else:
+            app_profiles = old.app_profiles
+
+        return _HookConfig(
+            interval=interval,
+            interval_ns=_to_ns(interval),
+            blacklist=blacklist,
+            app_profiles=app_profiles,
+            enabled=self.settings.get_enabled(),
+            threshold=threshold,
+            strict=self.settings.get_strict_mode(),
+            min_reversal=min_reversal,
+            min_reversal_ns=_to_ns(min_reversal),
+            smart=self.settings.get_smart_momentum(),
+            per_app=bool(blacklist or app_profiles),
+            default_pair=(_to_ns(interval), threshold),
+        )
+
+    def _resolve_foreground(self, now):
+        """
+        Returns the lower-cased foreground app name.
+        Within FOREGROUND_BURST_NS of the last lookup the cached name is returned without
+        even calling GetForegroundWindow; otherwise the TTL-memoized
+        get_foreground_process_name is used and the name is only re-lowered when it changes.
+        """
+        if now < self._fg_expiry_ns:
+            return self.last_app_name
+        self._fg_expiry_ns = now + self.FOREGROUND_BURST_NS
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            if hwnd != self.last_hwnd:
-                self.last_hwnd = hwnd
-                # Only fetch from psutil if the window handle changed
-                self.last_app_name = get_foreground_process_name()
+            name = get_foreground_process_name()
+            if name != self.last_app_raw:
+                self.last_app_raw = name
+                self.last_app_name = name.lower() if name else None
             return self.last_app_name
         except Exception:
             return None
 
-    def _get_current_app_settings(self, app_name, cfg):
-        """Resolves settings for the specific app from the config snapshot."""
-        if app_name and app_name in cfg['app_profiles']:
-            profile = cfg['app_profiles'][app_name]
-            return profile.get('interval', cfg['interval']), \
-                   profile.get('threshold', cfg['threshold'])
-        return cfg['interval'], cfg['threshold']
-
     def is_blacklisted(self, app_name, cfg) -> bool:
         if not app_name:
             return False
-        # Blacklist is already lowercased in reload_settings
-        return app_name.lower() in cfg['blacklist']
+        # Both sides are already lower-cased (reload_settings / _resolve_foreground)
+        return app_name in cfg.blacklist
+
+    def _drain_events(self):
+        """
+        Worker loop that applies counters and writes log records posted by hook_proc.
+        Keeps logging I/O and bookkeeping off the hook thread, which only decides block/pass.
+        """
+        get = self._evt_q.get
+        while True:
+            evt = get()
+            if evt is None:
+                break
+            if evt[0] == 'blocked':
+                if evt[1] > 0:
+                    self.blocked_up += 1
+                else:
+                    self.blocked_down += 1
+            else:
+                logging.debug(evt[1], *evt[2])
 
     def start(self):
         self.thread_id = self.kernel32.GetCurrentThreadId()
+
+        self._evt_worker = threading.Thread(target=self._drain_events, daemon=True)
+        self._evt_worker.start()
+        post = self._evt_q.put
         
         # Define LRESULT for 64-bit compatibility
         LRESULT = ctypes.c_longlong if ctypes.sizeof(ctypes.c_void_p) == 8 else ctypes.c_long
         
+        # lParam arrives as a plain integer address: every mouse move/click reaches this
+        # callback, and an int is cheaper for ctypes to build than a POINTER instance
         CMPFUNC = ctypes.WINFUNCTYPE(
             LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM
         )
 
+        # Set return type for CallNextHookEx to match LRESULT; lParam is forwarded as the raw pointer.
+        # The hhk argument is ignored by Windows, so None avoids a self.hook_id lookup per event.
+        call_next = self.user32.CallNextHookEx
+        call_next.restype = LRESULT
+        call_next.argtypes = [ctypes.c_void_p, ctypes.c_int, wintypes.WPARAM, ctypes.c_void_p]
+        # Monotonic, QueryPerformanceCounter-backed and integer: immune to wall-clock jumps
+        now_fn = time.perf_counter_ns
+
+        # WH_MOUSE_LL fires for every mouse move and click, not just wheel ticks, so the
+        # rejection test for non-wheel messages must not touch any module attributes.
+        wm_mousewheel = win32con.WM_MOUSEWHEEL
+        # Bound once so each event pays a closure load instead of attribute lookups
+        resolve_foreground = self._resolve_foreground
+        is_blacklisted = self.is_blacklisted
+        smart_very_fast_ns = self.SMART_VERY_FAST_NS
+        smart_fast_ns = self.SMART_FAST_NS
+        smart_bumps = (2, 1, 0)
+        # Only mouseData is needed, so read that DWORD straight from the struct's address
+        dword_at = ctypes.c_uint32.from_address
+        mouse_data_offset = MSLLHOOKSTRUCT.mouseData.offset
+
         def hook_proc(nCode, wParam, lParam):
+            if wParam != wm_mousewheel or nCode != 0:
+                return call_next(None, nCode, wParam, lParam)
             try:
-                if nCode == 0 and wParam == win32con.WM_MOUSEWHEEL:
-                    # 1. ATOMIC SNAPSHOT: Grab reference to current config
-                    cfg = self.config_snapshot
-
-                    ms = ctypes.cast(lParam, ctypes.POINTER(MSLLHOOKSTRUCT)).contents
-                    delta_short = ctypes.c_short((ms.mouseData >> 16) & 0xFFFF).value
-                    current_dir = 1 if delta_short > 0 else -1
-                    now = time.time()
-
-                    # --- CALIBRATION MODE ---
-                    if self.calibration_callback:
-                        self.calibration_callback(now, current_dir)
-                        return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
-
-                    if not cfg['enabled']:
-                        return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
-
-                    # --- PERFORMANCE OPTIMIZATION ---
-                    current_app_name = self._get_foreground_app_name()
-
-                    if self.is_blacklisted(current_app_name, cfg):
-                        return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
-
-                    current_block_interval, current_direction_change_threshold = self._get_current_app_settings(current_app_name, cfg)
-                    
-                    time_diff = now - self.last_time
-                    
-                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                        logging.debug(f"HOOK: Delta={delta_short}, Dir={current_dir}, LastDir={self.last_dir}, TimeDiff={time_diff:.4f}")
-
-                    # --- PHYSICS CHECK (The "Impossible Speed" Filter) ---
-                    if (self.last_dir is not None) and (current_dir != self.last_dir) and (time_diff < cfg['min_reversal']):
-                        if logging.getLogger().isEnabledFor(logging.DEBUG):
-                            logging.debug(f"HOOK: PHYSICS BLOCK (Impossible Reversal: {time_diff:.4f}s < {cfg['min_reversal']}s)")
-                        return 1
-
-                    # Check if the current session (blocking interval) has expired
-                    if (self.last_dir is not None) and (time_diff >= current_block_interval):
-                        self.last_dir = None
-                        self.pending_start_dir = None
-                        self._consecutive_opposite_events = 0
-
-                    if self.last_dir is None:
-                        # Starting a new sequence
-                        if cfg['strict']:
-                            if self.pending_start_dir is None:
-                                # First tick: Block and wait for confirmation
+                # 1. ATOMIC SNAPSHOT: Grab reference to current config
+                cfg = self.config_snapshot
+
+                # High word of mouseData is the signed wheel delta
+                raw = dword_at(lParam + mouse_data_offset).value >> 16
+                delta_short = raw - 0x10000 if raw & 0x8000 else raw
+                current_dir = 1 if delta_short > 0 else -1
+                now = now_fn()
+
+                # --- CALIBRATION MODE ---
+                if self.calibration_callback:
+                    # Wizard timestamps are perf_counter() seconds
+                    self.calibration_callback(now / NS_PER_SEC, current_dir)
+                    return call_next(None, nCode, wParam, lParam)
+
+                if not cfg.enabled:
+                    return call_next(None, nCode, wParam, lParam)
+
+                # --- PERFORMANCE OPTIMIZATION ---
+                # With no blacklist and no profiles the foreground app can't change the outcome
+                if cfg.per_app:
+                    current_app_name = resolve_foreground(now)
+
+                    if is_blacklisted(current_app_name, cfg):
+                        return call_next(None, nCode, wParam, lParam)
+
+                    # Profiles hold fully resolved (interval_ns, threshold) pairs
+                    current_block_interval_ns, current_direction_change_threshold = cfg.app_profiles.get(current_app_name, cfg.default_pair)
+                else:
+                    current_block_interval_ns, current_direction_change_threshold = cfg.default_pair
+                
+                time_diff = now - self.last_time
+                
+                if _DEBUG_HOOK:
+                    post(('log', "HOOK: Delta=%d, Dir=%d, LastDir=%s, TimeDiff=%.4f", (delta_short, current_dir, self.last_dir, time_diff / NS_PER_SEC)))
+
+                # --- PHYSICS CHECK (The "Impossible Speed" Filter) ---
+                if (self.last_dir is not None) and (current_dir != self.last_dir) and (time_diff < cfg.min_reversal_ns):
+                    if _DEBUG_HOOK:
+                        post(('log', "HOOK: PHYSICS BLOCK (Impossible Reversal: %.4fs < %ss)", (time_diff / NS_PER_SEC, cfg.min_reversal)))
+                    return 1
+
+                # Check if the current session (blocking interval) has expired
+                if (self.last_dir is not None) and (time_diff >= current_block_interval_ns):
+                    self.last_dir = None
+                    self.pending_start_dir = None
+                    self._consecutive_opposite_events = 0
+
+                if self.last_dir is None:
+                    # Starting a new sequence
+                    if cfg.strict:
+                        if self.pending_start_dir is None:
+                            # First tick: Block and wait for confirmation
+                            self.pending_start_dir = current_dir
+                            self.last_time = now
+                            if _DEBUG_HOOK:
+                                post(('log', "HOOK: BLOCK (Strict: First Tick)", ()))
+                            return 1
+                        else:
+                            # Second tick: Check confirmation
+                            if current_dir == self.pending_start_dir:
+                                # Confirmed
+                                self.last_dir = current_dir
+                                self.last_time = now
+                                self.pending_start_dir = None
+                                if _DEBUG_HOOK:
+                                    post(('log', "HOOK: PASS (Strict: Confirmed)", ()))
+                                return call_next(None, nCode, wParam, lParam)
+                            else:
+                                # Mismatch (Glitch detected or user erratic)
+                                # Treat this as a NEW First Tick
                                 self.pending_start_dir = current_dir
                                 self.last_time = now
-                                if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                    logging.debug("HOOK: BLOCK (Strict: First Tick)")
+                                if _DEBUG_HOOK:
+                                    post(('log', "HOOK: BLOCK (Strict: Mismatch Reset)", ()))
                                 return 1
-                            else:
-                                # Second tick: Check confirmation
-                                if current_dir == self.pending_start_dir:
-                                    # Confirmed
-                                    self.last_dir = current_dir
-                                    self.last_time = now
-                                    self.pending_start_dir = None
-                                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                        logging.debug("HOOK: PASS (Strict: Confirmed)")
-                                    return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
-                                else:
-                                    # Mismatch (Glitch detected or user erratic)
-                                    # Treat this as a NEW First Tick
-                                    self.pending_start_dir = current_dir
-                                    self.last_time = now
-                                    if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                        logging.debug("HOOK: BLOCK (Strict: Mismatch Reset)")
-                                    return 1
-                        else:
-                            # Standard Mode: Allow immediately
-                            self.last_dir = current_dir
-                            self.last_time = now
-                            self._consecutive_opposite_events = 0
-                            if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                logging.debug("HOOK: PASS (Time/First)")
-                            return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
+                    else:
+                        # Standard Mode: Allow immediately
+                        self.last_dir = current_dir
+                        self.last_time = now
+                        self._consecutive_opposite_events = 0
+                        if _DEBUG_HOOK:
+                            post(('log', "HOOK: PASS (Time/First)", ()))
+                        return call_next(None, nCode, wParam, lParam)
+
+                # If we are here, last_dir is set (Active Session)
+                if current_dir == self.last_dir:
+                    self.last_time = now
+                    self._consecutive_opposite_events = 0
+                    self.pending_start_dir = None
+                    if _DEBUG_HOOK:
+                        post(('log', "HOOK: PASS (Same Dir)", ()))
+                    return call_next(None, nCode, wParam, lParam)
+                else:
+                    self._consecutive_opposite_events += 1
+                    
+                    # --- MOMENTUM CHECK (Smart Threshold) ---
+                    dynamic_threshold = current_direction_change_threshold
+                    
+                    if cfg.smart:
+                        # Bucket 0: Very Fast (< 100ms) +2, 1: Fast (< 200ms) +1, 2: slower +0
+                        dynamic_threshold += smart_bumps[(time_diff >= smart_very_fast_ns) + (time_diff >= smart_fast_ns)]
 
-                    # If we are here, last_dir is set (Active Session)
-                    if current_dir == self.last_dir:
+                    if _DEBUG_HOOK:
+                        post(('log', "HOOK: CHECK (Opposite Dir) dt=%.4fs | Count=%d/%d", (time_diff / NS_PER_SEC, self._consecutive_opposite_events, dynamic_threshold)))
+
+                    if self._consecutive_opposite_events >= dynamic_threshold:
+                        self.last_dir = current_dir
                         self.last_time = now
                         self._consecutive_opposite_events = 0
                         self.pending_start_dir = None
-                        if logging.getLogger().isEnabledFor(logging.DEBUG):
-                            logging.debug("HOOK: PASS (Same Dir)")
-                        return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
+                        if _DEBUG_HOOK:
+                            post(('log', "HOOK: PASS (Threshold Met)", ()))
+                        return call_next(None, nCode, wParam, lParam)
                     else:
-                        self._consecutive_opposite_events += 1
-                        
-                        # --- MOMENTUM CHECK (Smart Threshold) ---
-                        dynamic_threshold = current_direction_change_threshold
-                        
-                        if cfg['smart']:
-                            if time_diff < 0.10: # Very Fast (< 100ms)
-                                dynamic_threshold += 2
-                            elif time_diff < 0.20: # Fast (< 200ms)
-                                dynamic_threshold += 1
-
-                        if logging.getLogger().isEnabledFor(logging.DEBUG):
-                            logging.debug(f"HOOK: CHECK (Opposite Dir) dt={time_diff:.4f}s | Count={self._consecutive_opposite_events}/{dynamic_threshold}")
-
-                        if self._consecutive_opposite_events >= dynamic_threshold:
-                            self.last_dir = current_dir
-                            self.last_time = now
-                            self._consecutive_opposite_events = 0
-                            self.pending_start_dir = None
-                            if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                logging.debug("HOOK: PASS (Threshold Met)")
-                            return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
-                        else:
-                            if current_dir > 0:
-                                self.blocked_up += 1
-                            else:
-                                self.blocked_down += 1
-                            if logging.getLogger().isEnabledFor(logging.DEBUG):
-                                logging.debug("HOOK: BLOCK")
-                            return 1
+                        post(('blocked', current_dir))
+                        if _DEBUG_HOOK:
+                            post(('log', "HOOK: BLOCK", ()))
+                        return 1
             except Exception as e:
                 logging.critical(f"HOOK EXCEPTION: {e}", exc_info=True)
                 # Fallback to standard behavior to not freeze mouse
-                return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
+                return call_next(None, nCode, wParam, lParam)
 
-            return self.user32.CallNextHookEx(self.hook_id, nCode, wParam, lParam)
+            return call_next(None, nCode, wParam, lParam)
 
         self.hook_cb = CMPFUNC(hook_proc)
         
-        # Set return type for CallNextHookEx to match LRESULT
-        self.user32.CallNextHookEx.restype = LRESULT
-        self.user32.CallNextHookEx.argtypes = [ctypes.c_void_p, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
-        self.user32.SetWindowsHookExA.restype = ctypes.c_void_p # HHOOK
-
-        # For WH_MOUSE_LL, hMod should be NULL (0) if the hook proc is in the same process/thread context
-        self.hook_id = self.user32.SetWindowsHookExA(
-            win32con.WH_MOUSE_LL,
-            self.hook_cb,
-            0, 
-            0,
-        )
-        
-        if not self.hook_id:
-            error_code = self.kernel32.GetLastError()
-            logging.error(f"CRITICAL ERROR: Failed to install mouse hook. Error Code: {error_code}")
-        else:
-            logging.info(f"SUCCESS: Mouse hook installed. Hook ID: {self.hook_id}")
+        self.user32.SetWindowsHookExW.restype = ctypes.c_void_p # HHOOK
+        self._sync_hook()
+
+        # Message pump with prototyped APIs bound to locals and a single reusable MSG pointer.
+        # It must run on this thread: Windows delivers LL hook callbacks to the installing
+        # thread while it waits for messages. MsgWaitForMultipleObjectsEx parks it until
+        # input arrives or one of our events (shutdown / hook sync) is signalled.
+        # Wide variants skip the ANSI translation layer.
+        msg_wait = self.user32.MsgWaitForMultipleObjectsEx
+        msg_wait.restype = wintypes.DWORD
+        msg_wait.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+        peek_message = self.user32.PeekMessageW
+        peek_message.restype = wintypes.BOOL
+        peek_message.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT]
+        translate_message = self.user32.TranslateMessage
+        translate_message.restype = wintypes.BOOL
+        translate_message.argtypes = [ctypes.POINTER(wintypes.MSG)]
+        dispatch_message = self.user32.DispatchMessageW
+        dispatch_message.restype = LRESULT
+        dispatch_message.argtypes = [ctypes.POINTER(wintypes.MSG)]
 
         msg = wintypes.MSG()
+        msg_ref = ctypes.byref(msg)
+        handles = (wintypes.HANDLE * 2)(self._shutdown_evt, self._sync_evt)
+        wm_quit = win32con.WM_QUIT
         while True:
-            b = self.user32.GetMessageA(ctypes.byref(msg), None, 0, 0)
-            if b == 0:
+            r = msg_wait(2, handles, INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE)
+            if r == WAIT_OBJECT_0:
                 break
-            self.user32.TranslateMessage(ctypes.byref(msg))
-            self.user32.DispatchMessageA(ctypes.byref(msg))
+            if r == WAIT_OBJECT_0 + 1:
+                self._sync_hook()
+                continue
+            if r != WAIT_OBJECT_0 + 2:
+                logging.error(f"Hook message wait failed ({r}). Error Code: {self.kernel32.GetLastError()}")
+                break
+            # PeekMessage also runs pending sent messages, which is how LL hook calls arrive
+            while peek_message(msg_ref, None, 0, 0, PM_REMOVE):
+                if msg.message == wm_quit:
+                    return
+                translate_message(msg_ref)
+                dispatch_message(msg_ref)
 
     def stop(self):
+        self._evt_q.put(None)
         if self.hook_id:
             self.user32.UnhookWindowsHookEx(self.hook_id)
             self.hook_id = None
-        if self.thread_id:
-            self.user32.PostThreadMessageW(self.thread_id, win32con.WM_QUIT, 0, 0)
+        _SetEvent(self._shutdown_evt)
 
 def run_watchdog(parent_pid_str):
     """Monitors the parent process and restarts it if it crashes."""
     parent_pid = int(parent_pid_str)
     logging.basicConfig(level=logging.INFO, filename=os.path.join(tempfile.gettempdir(), 'scroll_lock_watchdog.log'), filemode='w')
     logging.info(f"Watchdog started for PID: {parent_pid}")
-    time.sleep(5)
-    while True:
-        if not psutil.pid_exists(parent_pid):
-            logging.warning(f"Parent PID {parent_pid} not found. Relaunching application.")
-            subprocess.Popen(
-                [sys.executable, os.path.abspath(__file__), "--no-watchdog"],
-                creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
-            )
-            break
-        time.sleep(2)
+    # Block on the parent's process handle: no polling, and we wake the moment it exits
+    handle = _OpenProcess(SYNCHRONIZE, False, parent_pid)
+    if handle:
+        try:
+            _WaitForSingleObject(handle, INFINITE)
+        finally:
+            _CloseHandle(handle)
+    logging.warning(f"Parent PID {parent_pid} not found. Relaunching application.")
+    subprocess.Popen(
+        [sys.executable, _SCRIPT_PATH, "--no-watchdog"],
+        creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+    )
     logging.info("Watchdog exiting.")
     sys.exit(0)
 
+# Global application stylesheet (applied once the hook thread is already running)
+APP_STYLESHEET = r"""
+    QWidget { font-family: "Segoe UI", "Helvetica Neue", Helvetica, Arial, sans-serif; font-size: 10pt; }
+    QPushButton { background-color: #0078D7; color: white; border: 1px solid #0078D7; border-radius: 4px; padding: 6px 18px; min-width: 80px; }
+    QPushButton:hover { background-color: #0056B3; border-color: #0056B3; }
+    QPushButton:pressed { background-color: #003f80; border-color: #003f80; }
+    QCheckBox::indicator { width: 16px; height: 16px; }
+    QGroupBox { font-weight: bold; margin-top: 20px; border: 1px solid #D0D0D0; border-radius: 6px; padding-top: 25px; padding-bottom: 10px; padding-left: 10px; padding-right: 10px; }
+    QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 5px; left: 10px; margin-left: 2px; color: #333333; background-color: transparent; }
+    QSpinBox, QDoubleSpinBox { border: 1px solid #D0D0D0; border-radius: 4px; padding: 3px; background-color: #FFFFFF; selection-background-color: #0078D7; selection-color: white; }
+    QListWidget { border: 1px solid #D0D0D0; border-radius: 4px; background-color: #FFFFFF; selection-background-color: #0078D7; selection-color: white; padding: 2px; }
+    QMenuBar { background-color: #f0f0f0; border-bottom: 1px solid #ccc; }
+    QMenuBar::item { padding: 5px 10px; background-color: transparent; }
+    QMenuBar::item:selected { background-color: #e0e0e0; }
+    QMenu { background-color: #f0f0f0; border: 1px solid #ccc; }
+    QMenu::item { padding: 5px 20px 5px 10px; }
+    QMenu::item:selected { background-color: #0078D7; color: white; }
+"""
+
 if __name__ == "__main__":
     def is_admin():
         try:
@@ -595,10 +1022,10 @@ if __name__ == "__main__":
         print("Requesting administrative privileges...")
         try:
             # Prepare arguments
-            script = os.path.abspath(__file__)
+            script = _SCRIPT_PATH
             params = ' '.join([f'"{arg}"' for arg in sys.argv[1:]])
             
-            if getattr(sys, 'frozen', False):
+            if _FROZEN:
                 executable = sys.executable
                 arguments = params
             else:
@@ -614,10 +1041,10 @@ if __name__ == "__main__":
     if len(sys.argv) > 2 and sys.argv[1] == "--watchdog":
         run_watchdog(sys.argv[2])
     else:
-        # Configure logging to both file and console with INFO level
+        # Configure logging to both file and console with INFO level (DEBUG with hook tracing)
         log_file = os.path.join(tempfile.gettempdir(), 'scroll_lock_main.log')
         logging.basicConfig(
-            level=logging.INFO,
+            level=logging.DEBUG if _DEBUG_HOOK else logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
                 logging.FileHandler(log_file, mode='w'),
@@ -637,15 +1064,26 @@ if __name__ == "__main__":
         app.setQuitOnLastWindowClosed(False)
         
         settings = Settings()
+        # Pending debounced writes must land even if we exit without aboutToQuit
+        atexit.register(settings.flush)
         logging.info('Settings loaded')
 
+        # Bring the hook online before any UI setup (stylesheet, tray, dialog, watchdog)
+        hook = MouseHook(settings)
+        logging.info('Mouse hook created')
+
+        # Register cleanup to run on exit
+        atexit.register(hook.stop)
+
+        t = threading.Thread(target=hook.start, daemon=True)
+        t.start()
+        logging.info('Hook thread started')
+
         # Load Language
         translator.set_language(settings.get_language())
 
-        if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS
-        else:
-            base_path = os.path.dirname(__file__)
+        # Bundled resources live in the PyInstaller extraction dir when frozen
+        base_path = sys._MEIPASS if _FROZEN else os.path.dirname(_SCRIPT_PATH)
         icon_path = os.path.join(base_path, "mouse.ico")
         app_icon = QtGui.QIcon(icon_path)
         app.setWindowIcon(app_icon)
@@ -657,30 +1095,14 @@ if __name__ == "__main__":
         apply_global_font()
         logging.info('Font applied')
 
-        app.setStyleSheet(r"""
-            QWidget { font-family: "Segoe UI", "Helvetica Neue", Helvetica, Arial, sans-serif; font-size: 10pt; }
-            QPushButton { background-color: #0078D7; color: white; border: 1px solid #0078D7; border-radius: 4px; padding: 6px 18px; min-width: 80px; }
-            QPushButton:hover { background-color: #0056B3; border-color: #0056B3; }
-            QPushButton:pressed { background-color: #003f80; border-color: #003f80; }
-            QCheckBox::indicator { width: 16px; height: 16px; }
-            QGroupBox { font-weight: bold; margin-top: 20px; border: 1px solid #D0D0D0; border-radius: 6px; padding-top: 25px; padding-bottom: 10px; padding-left: 10px; padding-right: 10px; }
-            QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 5px; left: 10px; margin-left: 2px; color: #333333; background-color: transparent; }
-            QSpinBox, QDoubleSpinBox { border: 1px solid #D0D0D0; border-radius: 4px; padding: 3px; background-color: #FFFFFF; selection-background-color: #0078D7; selection-color: white; }
-            QListWidget { border: 1px solid #D0D0D0; border-radius: 4px; background-color: #FFFFFF; selection-background-color: #0078D7; selection-color: white; padding: 2px; }
-            QMenuBar { background-color: #f0f0f0; border-bottom: 1px solid #ccc; }
-            QMenuBar::item { padding: 5px 10px; background-color: transparent; }
-            QMenuBar::item:selected { background-color: #e0e0e0; }
-            QMenu { background-color: #f0f0f0; border: 1px solid #ccc; }
-            QMenu::item { padding: 5px 20px 5px 10px; }
-            QMenu::item:selected { background-color: #0078D7; color: white; }
-        """)
+        app.setStyleSheet(APP_STYLESHEET)
         logging.info('Stylesheet applied')
 
         watchdog_process = None
         if settings.get_startup() and "--no-watchdog" not in sys.argv:
             try:
                 watchdog_process = subprocess.Popen(
-                    [sys.executable, os.path.abspath(__file__), "--watchdog", str(os.getpid())],
+                    [sys.executable, _SCRIPT_PATH, "--watchdog", str(os.getpid())],
                     creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
                 )
                 logging.info('Watchdog process spawned')
@@ -688,16 +1110,6 @@ if __name__ == "__main__":
                 logging.error(f'Watchdog spawn failed: {e}')
                 print(f"[Main] Watchdog spawn failed: {e}")
 
-        hook = MouseHook(settings)
-        logging.info('Mouse hook created')
-
-        # Register cleanup to run on exit
-        atexit.register(hook.stop)
-
-        t = threading.Thread(target=hook.start, daemon=True)
-        t.start()
-        logging.info('Hook thread started')
-
         tray_icon = app_icon
         logging.info('Tray icon loaded')
         tray = QtWidgets.QSystemTrayIcon(tray_icon, parent=app)
@@ -720,9 +1132,20 @@ if __name__ == "__main__":
         logging.info('Tray icon shown')
 
         app_context = AppContext(settings, hook, update_tray_icon, apply_global_font, tray, tray_icon)
-        dlg = SettingsDialog(app_context, configure_startup)
-        act_settings.triggered.connect(dlg.show)
-        logging.info('Settings dialog created')
+
+        # The settings dialog is built on first use rather than at boot
+        dlg = None
+        def get_settings_dialog():
+            global dlg
+            if dlg is None:
+                dlg = SettingsDialog(app_context, configure_startup)
+                dlg.languageChanged.connect(refresh_tray_menu_text)
+                logging.info('Settings dialog created')
+            return dlg
+
+        def show_settings_dialog():
+            get_settings_dialog().show()
+        act_settings.triggered.connect(show_settings_dialog)
 
         def refresh_tray_menu_text():
              act_settings.setText(translator.tr("tray_settings"))
@@ -731,14 +1154,12 @@ if __name__ == "__main__":
              act_about.setText(translator.tr("tray_about"))
              act_exit.setText(translator.tr("tray_exit"))
 
-        # Connect signal instead of monkey-patching
-        dlg.languageChanged.connect(refresh_tray_menu_text)
-
 
         def toggle_enabled_from_tray():
             current_state = settings.get_enabled()
             settings.set_enabled(not current_state)
-            hook.reload_settings(update_tray_icon, apply_global_font)
+            settings.request_sync()
+            hook.reload_settings(update_tray_icon)
             update_tray_icon()
             
             status_text = translator.tr("tray_enabled") if not current_state else translator.tr("tray_disabled")
@@ -747,10 +1168,11 @@ if __name__ == "__main__":
             )
         act_toggle_enabled.triggered.connect(toggle_enabled_from_tray)
 
+        # The tray shares the settings dialog's Help/About instances instead of building new ones
         def show_help_dialog():
-            HelpDialog(dlg).exec_()
+            get_settings_dialog().show_help_dialog()
         def show_about_dialog():
-            AboutDialog(dlg).exec_()
+            get_settings_dialog().show_about_dialog()
         def exit_app():
             if watchdog_process:
                 try:
@@ -771,19 +1193,29 @@ if __name__ == "__main__":
         act_about.triggered.connect(show_about_dialog)
         act_exit.triggered.connect(exit_app)
 
-        dlg.show()
-        logging.info('Settings dialog shown')
+        # Build and show the dialog from the running event loop, once the tray is already up
+        QtCore.QTimer.singleShot(0, show_settings_dialog)
 
         def restore_window(reason):
             if reason == QtWidgets.QSystemTrayIcon.Trigger:
-                dlg.showNormal()
-                dlg.activateWindow()
+                dialog = get_settings_dialog()
+                dialog.showNormal()
+                dialog.activateWindow()
         tray.activated.connect(restore_window)
 
         def on_about_to_quit():
             logging.info('Application quitting')
-            settings.sync()
+            settings.flush()
         app.aboutToQuit.connect(on_about_to_quit)
 
+        # Automatic cyclic GC could fire inside hook_proc (allocation-triggered) and stall the
+        # LL hook past its timeout; collect on a GUI-thread timer instead, after freezing the
+        # long-lived startup objects so each pass only scans what has been allocated since.
+        gc.freeze()
+        gc.disable()
+        gc_timer = QtCore.QTimer(app)
+        gc_timer.timeout.connect(gc.collect)
+        gc_timer.start(10_000)
+
         logging.info('Starting event loop')
         sys.exit(app.exec_())
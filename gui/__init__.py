@@ -1,4 +1,12 @@
 """This file makes the gui directory a package and exposes the necessary classes."""
 from .settings_dialog import SettingsDialog
-from .help_dialog import HelpDialog
-from .about_dialog import AboutDialog
+
+def __getattr__(name):
+    # Rarely opened dialogs are imported on first access instead of at package import
+    if name == "HelpDialog":
+        from .help_dialog import HelpDialog
+        return HelpDialog
+    if name == "AboutDialog":
+        from .about_dialog import AboutDialog
+        return AboutDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 # gui/about_dialog.py
 """The about dialog for the application."""
-from PyQt5 import QtWidgets, QtCore, QtGui
-import os
+from PyQt5 import QtWidgets, QtCore
+from .icons import window_icon
 
 class AboutDialog(QtWidgets.QDialog):
     """The about dialog."""
@@ -9,7 +9,7 @@ class AboutDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setStyleSheet(QtWidgets.QApplication.instance().styleSheet())
         self.setWindowTitle("About WheelScrollFixer")
-        self.setWindowIcon(QtGui.QIcon(os.path.join(os.path.dirname(__file__), "..", "mouse.ico")))
+        self.setWindowIcon(window_icon())
         self.setFixedSize(340, 210)
 
         layout = QtWidgets.QVBoxLayout(self)
@@ -1,24 +1,33 @@
 # gui/app_profile_dialog.py
 """The application profile dialog for the application."""
-import psutil
+import logging
 import win32gui
-import win32process
-from PyQt5 import QtWidgets, QtGui
-import os
+from PyQt5 import QtWidgets
+from .icons import window_icon
+from utils import get_window_process_name
 
 class AppProfileDialog(QtWidgets.QDialog):
     """The application profile dialog."""
     def __init__(self, parent=None, current_app_name=None, current_interval=0.3, current_threshold=2):
         super().__init__(parent)
         self.setWindowTitle("Application Profile")
-        self.setWindowIcon(QtGui.QIcon(os.path.join(os.path.dirname(__file__), "..", "mouse.ico")))
+        self.setWindowIcon(window_icon())
         self.setFixedSize(400, 250)
         
+        self._init_ui()
+        self.load(current_app_name, current_interval, current_threshold)
+
+    def load(self, current_app_name=None, current_interval=0.3, current_threshold=2):
+        """Fills the fields for a new add/edit round, so one dialog instance can be reused."""
         self.current_app_name = current_app_name
         self.current_interval = current_interval
         self.current_threshold = current_threshold
-        
-        self._init_ui()
+        # If editing, maybe don't allow changing name? Or allow rename.
+        # Let's allow rename for now.
+        self.app_name_input.setText(current_app_name or "")
+        self.interval_spin.setValue(current_interval)
+        self.threshold_spin.setValue(current_threshold)
+        self.app_name_input.setFocus()
 
     def _init_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
@@ -27,19 +36,13 @@ class AppProfileDialog(QtWidgets.QDialog):
         
         self.app_name_input = QtWidgets.QLineEdit()
         self.app_name_input.setPlaceholderText("e.g., chrome.exe")
-        if self.current_app_name:
-            self.app_name_input.setText(self.current_app_name)
-            # If editing, maybe don't allow changing name? Or allow rename.
-            # Let's allow rename for now.
         
         self.interval_spin = QtWidgets.QDoubleSpinBox()
         self.interval_spin.setRange(0.05, 5.0)
         self.interval_spin.setSingleStep(0.05)
-        self.interval_spin.setValue(self.current_interval)
         
         self.threshold_spin = QtWidgets.QSpinBox()
         self.threshold_spin.setRange(1, 10)
-        self.threshold_spin.setValue(self.current_threshold)
         
         form_layout.addRow("Application Name:", self.app_name_input)
         form_layout.addRow("Block Interval (s):", self.interval_spin)
@@ -64,14 +67,17 @@ class AppProfileDialog(QtWidgets.QDialog):
         self.ok_btn.setEnabled(is_valid)
 
     def _get_current_app(self):
+        hwnd = win32gui.GetForegroundWindow()
+        if not hwnd:
+            return
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            if not hwnd:
-                return
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            proc_name = psutil.Process(pid).name()
+            proc_name = get_window_process_name(hwnd)
+        except Exception as e: # Win32 lookups raise for windows that vanish or deny access
+            logging.error(f"Foreground app lookup failed: {e}")
+            proc_name = None
+        if proc_name:
             self.app_name_input.setText(proc_name)
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        else:
             QtWidgets.QMessageBox.warning(self, "Error", "Could not get foreground application name.")
 
     def get_profile_data(self):
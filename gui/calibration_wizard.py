@@ -1,10 +1,18 @@
 import time
+import logging
 import statistics
 import math
 import random
+import bisect
+import collections
+import threading
+from array import array
 from PyQt5 import QtWidgets, QtCore, QtGui
+from .icons import window_icon
 from localization import translator
 
+now = time.perf_counter # Monotonic; the hook's calibration timestamps use the same clock
+
 class LiveSignalWidget(QtWidgets.QWidget):
     """
     Visualizes scroll signals like an oscilloscope.
@@ -12,45 +20,135 @@ class LiveSignalWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(100)
-        self.setStyleSheet("background-color: #111; border-radius: 5px; border: 1px solid #333;")
-        self.signals = [] 
-        self.start_time = time.time()
+        # Plain QWidget subclasses don't paint stylesheet backgrounds; the panel is drawn into
+        # _bg_pixmap instead, which covers every pixel, so Qt can skip erasing underneath.
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+        self.signals = collections.deque() # (t, value), oldest on the left
+        self.start_time = now()
         self.scan_speed = 4.0 
         
+        # Frame timer paced to the display; it only runs while there is a trace to scroll
+        screen = QtGui.QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen else 0
         self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(30)
+        self.timer.setInterval(max(1, round(1000 / refresh_hz)) if refresh_hz > 0 else 16)
+        self.timer.timeout.connect(self._tick)
+        self._painted_empty = True # Last frame showed only the grid
+        
+        # Paint resources, built once instead of per frame
+        self._bg_color = QtGui.QColor("#111")
+        self._grid_pen = QtGui.QPen(QtGui.QColor("#333"), 1)
+        down_color, up_color = QtGui.QColor("#00E676"), QtGui.QColor("#FF1744")
+        self._pen_down = QtGui.QPen(down_color, 2)
+        self._pen_up = QtGui.QPen(up_color, 2)
+        # Heads are drawn as round-capped points; a 6 px cap is the old radius-3 dot
+        self._head_pen_down = QtGui.QPen(down_color, 6, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap)
+        self._head_pen_up = QtGui.QPen(up_color, 6, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap)
+        self._bg_pixmap = None
+
+    def _trim(self, t):
+        signals = self.signals
+        cutoff = t - self.scan_speed
+        while signals and signals[0][0] <= cutoff:
+            signals.popleft()
+
+    def _tick(self):
+        # Every plotted point slides left each frame, so the trace area is always dirty while
+        # signals are on screen; once the window has drained and the grid-only frame is up, go idle.
+        self._trim(now() - self.start_time)
+        if self.signals or not self._painted_empty:
+            self.update()
+        else:
+            self.timer.stop()
 
     def add_signal(self, value):
-        t = time.time() - self.start_time
-        self.signals.append((t, value))
-        self.signals = [s for s in self.signals if s[0] > t - self.scan_speed]
+        self.add_signals((value,))
+
+    def add_signals(self, values):
+        """Appends a batch of signal values that arrived within the same frame."""
+        t = now() - self.start_time
+        self.signals.extend([(t, v) for v in values])
+        self._trim(t)
+        self.update()
+        if self.isVisible() and not self.timer.isActive():
+            self.timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.signals and not self.timer.isActive():
+            self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_pixmap = None # Re-rendered at the new size on the next paint
+
+    def _render_background(self, w, h):
+        pixmap = QtGui.QPixmap(w, h)
+        pixmap.fill(self._bg_color)
+        p = QtGui.QPainter(pixmap)
+        p.setPen(self._grid_pen)
+        p.drawRect(0, 0, w - 1, h - 1) # Frame
+        p.drawLine(0, h//2, w, h//2)
+        p.end()
+        return pixmap
 
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
         w, h = self.width(), self.height()
         
-        # Grid
-        painter.setPen(QtGui.QPen(QtGui.QColor("#333"), 1))
-        painter.drawLine(0, h//2, w, h//2)
+        # Background, frame and grid (static; rendered once per size)
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_background(w, h)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
         
-        if not self.signals: return
+        self._painted_empty = not self.signals
+        if self._painted_empty: return
 
-        current_time = time.time() - self.start_time
+        current_time = now() - self.start_time
+        exposed = event.rect()
+        left, right = exposed.left() - 3, exposed.right() + 3 # Dot radius
         
+        # Collect geometry per color (stems as paths, heads as point lists), then draw each once
+        mid = h/2
+        x_scale = w / self.scan_speed
+        y_scale = h/3
+        down_stems, up_stems = QtGui.QPainterPath(), QtGui.QPainterPath()
+        down_heads, up_heads = [], []
+        # Samples are time ordered, so ones sharing a pixel column arrive back to back;
+        # when there are more samples than columns keep one per column and direction.
+        dense = len(self.signals) > w
+        last_col_down = last_col_up = None
         for t, val in self.signals:
-            rel_t = current_time - t
-            x = w - (rel_t / self.scan_speed * w)
-            y = h/2 - (val * (h/3))
-            
-            color = QtGui.QColor("#00E676") if val < 0 else QtGui.QColor("#FF1744")
-            painter.setPen(QtGui.QPen(color, 2))
-            painter.drawLine(int(x), int(h//2), int(x), int(y))
+            x = w - (current_time - t) * x_scale
+            if x < left or x > right: continue
+            if dense:
+                col = int(x)
+                if val < 0:
+                    if col == last_col_down: continue
+                    last_col_down = col
+                else:
+                    if col == last_col_up: continue
+                    last_col_up = col
+            y = mid - val * y_scale
+            stems, heads = (down_stems, down_heads) if val < 0 else (up_stems, up_heads)
+            stems.moveTo(x, mid)
+            stems.lineTo(x, y)
+            heads.append(QtCore.QPointF(x, y))
+
+        for pen, head_pen, stems, heads in ((self._pen_down, self._head_pen_down, down_stems, down_heads),
+                                            (self._pen_up, self._head_pen_up, up_stems, up_heads)):
+            if stems.isEmpty(): continue
+            # Stems are axis-aligned, so only the round heads get antialiasing
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+            painter.strokePath(stems, pen)
             
-            painter.setBrush(color)
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.drawEllipse(QtCore.QPointF(x, y), 3, 3)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            painter.setPen(head_pen)
+            painter.drawPoints(QtGui.QPolygonF(heads))
 
 class AnimationWidget(QtWidgets.QWidget):
     """
@@ -61,24 +159,75 @@ class AnimationWidget(QtWidgets.QWidget):
         self.setMinimumSize(200, 150)
         self.mode = "idle" # idle, down, up, sprint, brake_go, brake_stop
         self.frame = 0
+        self._stop_px = {} # color name -> rendered stop sign, valid for the current size
+        self._arrow_paths = {} # mode -> all arrows of that mode at offset 0, valid for the current size
         self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(20) # 50 FPS
         self.timer.timeout.connect(self.animate)
-        self.timer.start(20) # 50 FPS
+
+    def _sync_timer(self):
+        # "idle" is a static caption, so only the animated modes need frames, and only while shown
+        if self.mode != "idle" and self.isVisible():
+            if not self.timer.isActive():
+                self.timer.start()
+        else:
+            self.timer.stop()
 
     def set_mode(self, mode):
         self.mode = mode
         self.frame = 0
+        self._sync_timer()
         self.update()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_timer()
+
+    ARROW_HALF_WIDTH = 30 # Widest arrow arm (25) plus its pen and antialiasing margin
+
     def animate(self):
         self.frame += 1
-        self.update()
+        if self.mode == "brake_stop":
+            # The stop sign only changes when it flips color every 10 frames
+            if self.frame % 10 == 0:
+                self.update()
+        else:
+            # Arrows only ever occupy a vertical band around the center
+            cx = self.width() // 2
+            self.update(cx - self.ARROW_HALF_WIDTH, 0, 2 * self.ARROW_HALF_WIDTH, self.height())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._stop_px.clear()
+        self._arrow_paths.clear()
+
+    def _build_stop_pixmap(self, color_name):
+        w, h = self.width(), self.height()
+        cx, cy = w // 2, h // 2
+        pixmap = QtGui.QPixmap(w, h)
+        pixmap.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(pixmap)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        p.setBrush(QtGui.QColor(color_name))
+        p.setPen(QtCore.Qt.NoPen)
+        size = 100
+        p.drawEllipse(cx - size//2, cy - size//2, size, size)
+        
+        p.setPen(QtGui.QColor("white"))
+        p.setFont(QtGui.QFont("Arial", 24, QtGui.QFont.Bold))
+        p.drawText(pixmap.rect(), QtCore.Qt.AlignCenter, "STOP")
+        p.end()
+        return pixmap
 
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
         w, h = self.width(), self.height()
-        cx, cy = w // 2, h // 2
+        cx = w // 2
 
         if self.mode == "idle":
             painter.setPen(QtGui.QColor("#555"))
@@ -90,82 +239,125 @@ class AnimationWidget(QtWidgets.QWidget):
             speed = 2
             offset = (self.frame * speed) % 40
             painter.setPen(QtGui.QPen(QtGui.QColor("#673AB7"), 3))
-            for i in range(-1, 4):
-                y = (i * 40) + offset
-                if 0 < y < h:
-                    self.draw_arrow(painter, cx, y, 20, 1) # 1 = down
+            painter.translate(0, offset)
+            painter.drawPath(self._arrow_path("down", cx, range(-40, 160, 40), 20, 1)) # 1 = down
 
         elif self.mode == "up":
             # Draw rising arrows
             speed = 1 # Slower
             offset = (self.frame * speed) % 40
             painter.setPen(QtGui.QPen(QtGui.QColor("#009688"), 3))
-            for i in range(0, 5):
-                y = h - ((i * 40) + offset)
-                if 0 < y < h:
-                    self.draw_arrow(painter, cx, y, 20, -1) # -1 = up
+            painter.translate(0, -offset)
+            painter.drawPath(self._arrow_path("up", cx, range(h, h - 200, -40), 20, -1)) # -1 = up
 
         elif self.mode == "sprint":
             # Fast falling arrows with blur effect
             speed = 8
             offset = (self.frame * speed) % 60
             painter.setPen(QtGui.QPen(QtGui.QColor("#FF5722"), 4))
-            for i in range(-1, 4):
-                y = (i * 60) + offset
-                if 0 < y < h:
-                    self.draw_arrow(painter, cx, y, 25, 1)
+            painter.translate(0, offset)
+            painter.drawPath(self._arrow_path("sprint", cx, range(-60, 240, 60), 25, 1))
 
         elif self.mode == "brake_go":
             # Green arrows
             speed = 5
             offset = (self.frame * speed) % 50
             painter.setPen(QtGui.QPen(QtGui.QColor("#4CAF50"), 4))
-            for i in range(-1, 4):
-                y = (i * 50) + offset
-                if 0 < y < h:
-                    self.draw_arrow(painter, cx, y, 25, 1)
+            painter.translate(0, offset)
+            painter.drawPath(self._arrow_path("brake_go", cx, range(-50, 200, 50), 25, 1))
 
         elif self.mode == "brake_stop":
-            # Flashing Stop Sign
+            # Flashing Stop Sign, alternating between two pre-rendered frames
             if (self.frame // 10) % 2 == 0:
-                color = QtGui.QColor("#D32F2F") # Red
+                color_name = "#D32F2F" # Red
             else:
-                color = QtGui.QColor("#B71C1C") # Dark Red
-            
-            painter.setBrush(color)
-            painter.setPen(QtCore.Qt.NoPen)
-            size = 100
-            painter.drawEllipse(cx - size//2, cy - size//2, size, size)
+                color_name = "#B71C1C" # Dark Red
             
-            painter.setPen(QtGui.QColor("white"))
-            painter.setFont(QtGui.QFont("Arial", 24, QtGui.QFont.Bold))
-            painter.drawText(self.rect(), QtCore.Qt.AlignCenter, "STOP")
-
-    def draw_arrow(self, painter, x, y, size, direction):
+            pixmap = self._stop_px.get(color_name)
+            if pixmap is None:
+                pixmap = self._stop_px[color_name] = self._build_stop_pixmap(color_name)
+            painter.drawPixmap(0, 0, pixmap)
+
+    def _arrow_path(self, mode, x, tips, size, direction):
+        # One path per mode holding every arrow; paintEvent only translates it by the frame offset
+        path = self._arrow_paths.get(mode)
+        if path is None:
+            path = QtGui.QPainterPath()
+            for y in tips:
+                self.add_arrow(path, x, y, size, direction)
+            self._arrow_paths[mode] = path
+        return path
+
+    def add_arrow(self, path, x, y, size, direction):
         # direction: 1 for down, -1 for up
-        path = QtGui.QPainterPath()
         path.moveTo(x - size, y - (size * direction))
         path.lineTo(x, y)
         path.lineTo(x + size, y - (size * direction))
-        painter.drawPath(path)
 
 
+# Starting point of every recommendation, and the result shown if the analysis fails
+_DEFAULT_RECOMMENDATION = {'interval': 0.3, 'threshold': 2, 'strict': True, 'min_reversal': 0.05, 'smart': True, 'diagnosis': ""}
+
+class _AnalysisSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(dict)
+
+class _AnalysisTask(QtCore.QRunnable):
+    """
+    Runs the calibration analysis on a QThreadPool worker and reports the result via a signal.
+    """
+    def __init__(self, fn, fallback):
+        super().__init__()
+        self.fn = fn
+        self.fallback = fallback
+        self.signals = _AnalysisSignals()
+
+    def run(self):
+        # Always report back: the wizard waits on "processing" until a result arrives
+        result = self.fallback
+        try:
+            result = self.fn()
+        except Exception:
+            logging.exception("Calibration analysis failed")
+        finally:
+            self.signals.done.emit(result)
+
 class CalibrationWizardDialog(QtWidgets.QDialog):
+    # Emitted from the hook thread when the pending batch goes from empty to non-empty
+    events_pending = QtCore.pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(750, 650)
-        self.setWindowIcon(QtGui.QIcon("mouse.ico"))
+        self.setWindowIcon(window_icon())
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
         
+        # Stage recordings are (timestamps, directions) array pairs: 'd' seconds, 'b' -1/1.
+        # Brake attempts share one pair; attempt i spans starts[i]:starts[i+1] and stopped at stop_times[i].
         self.session_data = {
-            'flow_down': [],
-            'sprint_down': [],
-            'brake_tests': [],
-            'precision_up': []
+            'flow_down': (array('d'), array('b')),
+            'sprint_down': (array('d'), array('b')),
+            'brake_tests': {'ts': array('d'), 'dirs': array('b'), 'starts': array('L', [0]), 'stop_times': array('d')},
+            'precision_up': (array('d'), array('b'))
         }
         
         self.current_stage_idx = 0
         self.is_active = False
+        self._rng = random.Random() # Private generator for the brake-signal delays
+        
+        # Stage timers, created once and restarted per stage / brake attempt
+        self.stage_timer = QtCore.QTimer(self)
+        self.stage_timer.timeout.connect(self.update_time_stage)
+        self.brake_timer = QtCore.QTimer(self)
+        self.brake_timer.setSingleShot(True)
+        self.brake_timer.timeout.connect(self.trigger_stop_signal)
+        self.bounce_timer = QtCore.QTimer(self)
+        self.bounce_timer.setSingleShot(True)
+        self.bounce_timer.timeout.connect(self.next_brake_attempt)
+        
+        # Raw events from the hook thread, drained in batches on the GUI thread
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self.events_pending.connect(self._drain_pending, QtCore.Qt.QueuedConnection)
         
         self._init_ui()
         self._init_stages()
@@ -277,7 +469,8 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
         self.header_lbl.setText(tr(title_key))
         self.instruction_lbl.setText(tr(instr_key))
         self.anim_widget.set_mode(anim)
-        self.progress_bar.setValue(0)
+        self._shown_progress = None
+        self._set_progress(0)
         self.progress_bar.show()
         self.action_btn.hide()
         
@@ -285,49 +478,70 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
         self.current_target = target
         self.current_count = 0
         self.current_type = st_type
-        self.stage_buffer = []
+        self._new_stage_buffer()
         
         if st_type == "time":
             self.progress_bar.setRange(0, 100)
-            self.timer_start = time.time()
+            self.timer_start = now()
             self.timer_duration = target
-            self.stage_timer = QtCore.QTimer(self)
-            self.stage_timer.timeout.connect(self.update_time_stage)
             self.stage_timer.start(50)
             
         elif st_type == "brake":
             self.progress_bar.setRange(0, target)
             self.brake_sub_state = "go"
             self.brake_attempts = 0
-            self.brake_timer = QtCore.QTimer(self)
-            self.brake_timer.setSingleShot(True)
-            self.brake_timer.timeout.connect(self.trigger_stop_signal)
-            self.brake_timer.start(random.randint(2000, 4000)) # Longer random delay
+            self.session_data['brake_tests'] = {'ts': self.stage_ts, 'dirs': self.stage_dir,
+                                                'starts': array('L', [0]), 'stop_times': array('d')}
+            self.brake_timer.start(self._rng.randrange(2000, 4001)) # Longer random delay
             
         else:
             self.progress_bar.setRange(0, target)
 
+    def _new_stage_buffer(self):
+        # Fresh arrays per recording so finished ones can be handed over without copying
+        self.stage_ts = array('d')
+        self.stage_dir = array('b')
+
     def process_scroll_event(self, timestamp, direction):
-        QtCore.QMetaObject.invokeMethod(self, "_process_safe", 
-                                        QtCore.Qt.QueuedConnection,
-                                        QtCore.Q_ARG(float, timestamp),
-                                        QtCore.Q_ARG(int, direction))
+        # Called on the hook thread; only buffer here, the GUI thread picks the batch up.
+        with self._pending_lock:
+            self._pending.append((timestamp, direction))
+            wake = len(self._pending) == 1
+        if wake:
+            # Events landing before the GUI thread gets to it join the same batch
+            self.events_pending.emit()
+
+    def _drain_pending(self):
+        with self._pending_lock:
+            if not self._pending: return
+            batch, self._pending = self._pending, []
 
-    @QtCore.pyqtSlot(float, int)
-    def _process_safe(self, timestamp, direction):
         # -1 is Down, 1 is Up. Visualizer expects same.
-        self.visualizer.add_signal(direction * -1 if direction == -1 else 1)
-        
+        self.visualizer.add_signals([direction * -1 if direction == -1 else 1 for _, direction in batch])
+
+        for timestamp, direction in batch:
+            self._process_event(timestamp, direction)
+        if self.is_active and self.current_type in ["flow", "precision"]:
+            self._set_progress(self.current_count) # Once per batch, not per counted event
+
+    def _set_progress(self, value):
+        # Every setValue restyles the bar, so skip writes that would not move it
+        if value != self._shown_progress:
+            self._shown_progress = value
+            self.progress_bar.setValue(value)
+
+    def _process_event(self, timestamp, direction):
         if not self.is_active: return
 
-        self.stage_buffer.append((timestamp, direction))
+        self.stage_ts.append(timestamp)
+        self.stage_dir.append(direction)
         
         if self.current_type in ["flow", "precision"]:
             target_dir = -1 if self.current_type == "flow" else 1
             if direction == target_dir:
                 self.current_count += 1
-                self.progress_bar.setValue(self.current_count)
                 if self.current_count >= self.current_target:
+                    self._set_progress(self.current_count)
                     self.finish_current_stage()
 
         elif self.current_type == "brake":
@@ -335,9 +549,9 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
             pass
 
     def update_time_stage(self):
-        elapsed = time.time() - self.timer_start
+        elapsed = now() - self.timer_start
         progress = (elapsed / self.timer_duration) * 100
-        self.progress_bar.setValue(int(progress))
+        self._set_progress(int(progress))
         if elapsed >= self.timer_duration:
             self.stage_timer.stop()
             self.finish_current_stage()
@@ -347,19 +561,17 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
         self.brake_sub_state = "stop"
         self.anim_widget.set_mode("brake_stop") # FLASHING STOP
         self.instruction_lbl.setText(tr("calib_stop_signal"))
-        self.stop_timestamp = time.time()
-        QtCore.QTimer.singleShot(2000, self.next_brake_attempt) # 2s wait for bounce
+        self.stop_timestamp = now() # Same clock as the hook's event timestamps
+        self.bounce_timer.start(2000) # 2s wait for bounce
 
     def next_brake_attempt(self):
         tr = translator.tr
-        self.session_data['brake_tests'].append({
-            'stop_time': getattr(self, 'stop_timestamp', 0),
-            'events': list(self.stage_buffer)
-        })
-        self.stage_buffer.clear()
+        brake = self.session_data['brake_tests']
+        brake['stop_times'].append(getattr(self, 'stop_timestamp', 0))
+        brake['starts'].append(len(brake['ts'])) # Next attempt records from here
         
         self.brake_attempts += 1
-        self.progress_bar.setValue(self.brake_attempts)
+        self._set_progress(self.brake_attempts)
         
         if self.brake_attempts >= self.current_target:
             self.finish_current_stage()
@@ -367,15 +579,16 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
             self.brake_sub_state = "go"
             self.anim_widget.set_mode("brake_go")
             self.instruction_lbl.setText(tr("calib_scroll_down_again"))
-            self.brake_timer.start(random.randint(1500, 3000))
+            self.brake_timer.start(self._rng.randrange(1500, 3001))
 
     def finish_current_stage(self):
         tr = translator.tr
         self.is_active = False
         st_type = self.current_type
-        if st_type == "flow": self.session_data['flow_down'] = list(self.stage_buffer)
-        elif st_type == "time": self.session_data['sprint_down'] = list(self.stage_buffer)
-        elif st_type == "precision": self.session_data['precision_up'] = list(self.stage_buffer)
+        recording = (self.stage_ts, self.stage_dir)
+        if st_type == "flow": self.session_data['flow_down'] = recording
+        elif st_type == "time": self.session_data['sprint_down'] = recording
+        elif st_type == "precision": self.session_data['precision_up'] = recording
         
         if self.current_stage_idx < len(self.stages) - 1:
             self.header_lbl.setText(tr("calib_stage_complete"))
@@ -392,9 +605,18 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
         self.anim_widget.set_mode("idle")
         self.progress_bar.hide()
         self.visualizer.hide()
+        self.instruction_lbl.setText(tr("calib_phase_processing"))
+        self.action_btn.hide()
         
-        rec = self.run_maths()
-        
+        # Recording has finished, so the worker has session_data to itself
+        fallback = dict(_DEFAULT_RECOMMENDATION, diagnosis=tr("calib_diag_analysis_failed"))
+        task = _AnalysisTask(self.run_maths, fallback)
+        task.signals.done.connect(self._on_analysis_done, QtCore.Qt.QueuedConnection)
+        self._analysis_signals = task.signals # Keep the emitter alive until the result lands
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_analysis_done(self, rec):
+        tr = translator.tr
         report = (
             f"<span style='color:#ffffff;'><b>{tr('calib_diag_header')}</b><br>{rec['diagnosis']}<br><br>"
             f"<table cellspacing='8' cellpadding='5' style='font-size:11pt; color:#ffffff;'>"
@@ -416,7 +638,7 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
     def run_maths(self):
         tr = translator.tr
         # Data Analysis Logic (Robust / Percentile Based)
-        rec = {'interval': 0.3, 'threshold': 2, 'strict': True, 'min_reversal': 0.05, 'smart': True, 'diagnosis': ""}
+        rec = dict(_DEFAULT_RECOMMENDATION)
         diag_lines = []
         
         def _get_percentile(data, p):
@@ -429,13 +651,9 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
             return data[int(f)] * (c - k) + data[int(c)] * (k - f)
 
         # 1. Physics / Glitch (Flow Phase)
-        flow = self.session_data['flow_down']
-        jitters = []
-        for i in range(1, len(flow)):
-            t, d = flow[i]
-            prev_t, prev_d = flow[i-1]
-            if d == 1: # UP glitch (Opposite to flow)
-                jitters.append(t - prev_t)
+        flow_ts, flow_dir = self.session_data['flow_down']
+        # UP glitch (Opposite to flow): gap from the preceding event
+        jitters = [t - prev_t for prev_t, t, d in zip(flow_ts, flow_ts[1:], flow_dir[1:]) if d == 1]
         
         if jitters:
             # Use 5th percentile to ignore ultra-rare random glitches, focus on mechanical faults
@@ -449,15 +667,13 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
             diag_lines.append(tr("calib_diag_signal_high_consistency"))
 
         # 2. Speed (Sprint Phase)
-        sprint = self.session_data['sprint_down']
-        if len(sprint) > 10:
+        sprint_ts = self.session_data['sprint_down'][0]
+        if len(sprint_ts) > 10:
             # Calculate gaps
-            gaps = []
-            for i in range(1, len(sprint)):
-                gaps.append(sprint[i][0] - sprint[i-1][0])
+            gaps = [cur - prev for prev, cur in zip(sprint_ts, sprint_ts[1:])]
             
             # Use Median to ignore pauses
-            median_gap = _get_percentile(gaps, 50)
+            median_gap = statistics.median(gaps)
             
             if median_gap < 0.05: # < 50ms average gap is fast
                 rec['smart'] = True
@@ -469,13 +685,13 @@ class CalibrationWizardDialog(QtWidgets.QDialog):
         
         # 3. Brake (Bounce Phase)
         bounces = []
-        for test in self.session_data['brake_tests']:
-            stop_t = test['stop_time']
-            after = [e for e in test['events'] if e[0] > stop_t]
-            if after:
-                first = after[0]
-                if first[1] == 1: # UP (Bounce)
-                    bounces.append(first[0] - stop_t)
+        brake = self.session_data['brake_tests']
+        ts, dirs, starts = brake['ts'], brake['dirs'], brake['starts']
+        for stop_t, lo, hi in zip(brake['stop_times'], starts, starts[1:]):
+            first = bisect.bisect_right(ts, stop_t, lo, hi) # Events are recorded in time order
+            if first < hi:
+                if dirs[first] == 1: # UP (Bounce)
+                    bounces.append(ts[first] - stop_t)
         
         if bounces:
             # Use 90th percentile (cover almost all bounces, ignore one crazy long delay)
@@ -1,7 +1,7 @@
 # gui/help_dialog.py
 """The help dialog for the application."""
-from PyQt5 import QtWidgets, QtGui
-import os
+from PyQt5 import QtWidgets
+from .icons import window_icon
 
 class HelpDialog(QtWidgets.QDialog):
     """The help dialog."""
@@ -9,7 +9,7 @@ class HelpDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setStyleSheet(QtWidgets.QApplication.instance().styleSheet())
         self.setWindowTitle("Scroll Lock Help")
-        self.setWindowIcon(QtGui.QIcon(os.path.join(os.path.dirname(__file__), "..", "mouse.ico")))
+        self.setWindowIcon(window_icon())
         self.setMinimumSize(580, 460)
 
         layout = QtWidgets.QVBoxLayout(self)
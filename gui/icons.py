@@ -0,0 +1,12 @@
+# gui/icons.py
+"""Shared window icon for the WheelScrollFixer dialogs."""
+import os
+import functools
+from PyQt5 import QtGui
+
+_ICON_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "mouse.ico"))
+
+@functools.lru_cache(maxsize=1)
+def window_icon():
+    """Returns the application icon, decoded from disk on first use and shared afterwards."""
+    return QtGui.QIcon(_ICON_PATH)
@@ -1,20 +1,122 @@
 """Settings dialog for the WheelScrollFixer application."""
-import os
-import sys
+import logging
 from utils import get_foreground_process_name
 from PyQt5 import QtWidgets, QtGui, QtCore
+from .icons import window_icon
 from .app_profile_dialog import AppProfileDialog
-from .help_dialog import HelpDialog
-from .about_dialog import AboutDialog
-from .calibration_wizard import CalibrationWizardDialog
 from localization import translator
 
+# Dark theme for the settings window; the dialog is built once and reused, so Qt parses this once per process
+_DIALOG_QSS = """
+    QDialog { background-color: #1e1e1e; color: #ffffff; font-family: 'Segoe UI', sans-serif; font-size: 10pt; }
+    QLabel { color: #e0e0e0; }
+    QLabel#pageTitle { font-size: 22pt; font-weight: bold; color: #fff; }
+    QLabel#status { color: #4caf50; font-weight: bold; }
+    QFrame#divider { background-color: #333; }
+    QGroupBox { border: 1px solid #3d3d3d; border-radius: 6px; margin-top: 24px; background-color: #252525; padding-top: 15px; }
+    QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 5px; left: 10px; color: #3a7bd5; font-weight: bold; }
+    
+    /* Sidebar */
+    QListWidget#sidebar { background-color: #2a2a2a; border: none; border-right: 1px solid #333; outline: none; font-size: 12pt; }
+    QListWidget#sidebar::item { padding: 20px; color: #aaaaaa; border-left: 5px solid transparent; margin-bottom: 2px; }
+    QListWidget#sidebar::item:selected { background-color: #333333; color: #ffffff; border-left: 5px solid #3a7bd5; }
+    QListWidget#sidebar::item:hover { background-color: #2d2d2d; }
+
+    /* Buttons */
+    QPushButton { background-color: #3d3d3d; color: #ffffff; border: none; border-radius: 4px; padding: 8px 16px; font-weight: bold; font-size: 10pt; }
+    QPushButton:hover { background-color: #4d4d4d; }
+    QPushButton:pressed { background-color: #2d2d2d; }
+    QPushButton#primary { background-color: #3a7bd5; }
+    QPushButton#primary:hover { background-color: #3a60d5; }
+    QPushButton#danger { background-color: #d32f2f; }
+    QPushButton#calib { font-size: 12pt; padding: 15px 22px; background-color: #673AB7; }
+    
+    /* Inputs */
+    QSpinBox, QDoubleSpinBox, QComboBox, QLineEdit { background-color: #333; border: 1px solid #444; border-radius: 4px; padding: 6px; color: #fff; font-size: 10pt; min-height: 20px; }
+    QComboBox::drop-down { border: none; }
+    
+    /* Checkbox */
+    QCheckBox { spacing: 8px; color: #eee; font-size: 10pt; }
+    QCheckBox::indicator { width: 20px; height: 20px; border: 1px solid #555; border-radius: 3px; background: #333; }
+    QCheckBox::indicator:checked { background-color: #3a7bd5; border-color: #3a7bd5; }
+    
+    /* Scrollbar */
+    QScrollBar:vertical { border: none; background: #1e1e1e; width: 10px; margin: 0; }
+    QScrollBar::handle:vertical { background: #444; min-height: 20px; border-radius: 5px; }
+"""
+
+# Sidebar rows in page order: (icon, title key)
+_SIDEBAR_PAGES = (("🎚️", "tab_sensitivity"), ("🚀", "tab_apps"), ("⚙️", "tab_general"))
+
+class _ForegroundSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(str)
+
+class _ForegroundLookup(QtCore.QRunnable):
+    """
+    Resolves the foreground process name on a QThreadPool worker and reports it via a signal.
+    """
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        # Always report back: the dialog stays hidden until the result arrives
+        name = ""
+        try:
+            name = get_foreground_process_name() or ""
+        except Exception as e:
+            logging.error(f"Foreground app lookup failed: {e}")
+        finally:
+            self.signals.done.emit(name)
+
 class ModernSettingsDialog(QtWidgets.QDialog):
     """The main settings dialog for the application, redesigned."""
     
     # Signal emitted when the language changes
     languageChanged = QtCore.pyqtSignal()
 
+    # (widget attribute, setter, translation key) per page, applied by _retranslate_page
+    _PAGE_TEXTS = (
+        (   # Sensitivity
+            ("calib_btn", "setText", "btn_calibration"),
+            ("grp_logic", "setTitle", "grp_blocking"),
+            ("interval_lbl", "setText", "lbl_interval"),
+            ("interval_spin", "setToolTip", "tip_interval"),
+            ("threshold_lbl", "setText", "lbl_threshold"),
+            ("threshold_spin", "setToolTip", "tip_threshold"),
+            ("reversal_lbl", "setText", "lbl_min_reversal"),
+            ("reversal_spin", "setToolTip", "tip_min_reversal"),
+            ("grp_adv", "setTitle", "grp_adv_features"),
+            ("strict_cb", "setText", "chk_strict"),
+            ("strict_cb", "setToolTip", "tip_strict"),
+            ("smart_cb", "setText", "chk_smart"),
+            ("smart_cb", "setToolTip", "tip_smart"),
+        ),
+        (   # Apps
+            ("grp_app", "setTitle", "grp_app_control"),
+            ("lbl_bl", "setText", "lbl_blacklist"),
+            ("btn_bl_add", "setText", "btn_add_current"),
+            ("btn_bl_rem", "setText", "btn_remove_selected"),
+            ("btn_bl_clr", "setText", "btn_clear_all"),
+            ("lbl_prof", "setText", "lbl_profiles"),
+            ("btn_prof_add", "setText", "btn_add_profile"),
+            ("btn_prof_edit", "setText", "btn_edit_profile"),
+            ("btn_prof_rem", "setText", "btn_remove_profile"),
+        ),
+        (   # General
+            ("grp_sys", "setTitle", "grp_system"),
+            ("enabled_cb", "setText", "chk_enable"),
+            ("enabled_cb", "setToolTip", "tip_enable"),
+            ("start_cb", "setText", "chk_start_boot"),
+            ("start_cb", "setToolTip", "tip_start_boot"),
+            ("font_lbl", "setText", "lbl_font_size"),
+            ("grp_info", "setTitle", "grp_info"),
+            ("btn_web", "setText", "btn_website"),
+            ("btn_help", "setText", "tray_help"),
+            ("btn_about", "setText", "tray_about"),
+        ),
+    )
+
     def __init__(self, app_context, configure_startup):
         super().__init__()
         self.app_context = app_context
@@ -25,13 +127,28 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         self.tray = app_context.tray
 
         self.configure_startup = configure_startup
+        self._fg_pick_pending = False # An "Add Current App" lookup is scheduled
+        self._fg_signals = _ForegroundSignals(self) # Delivers worker lookups back on the GUI thread
+        self._fg_signals.done.connect(self._on_foreground_app, QtCore.Qt.QueuedConnection)
+        self._profile_dialog = None # Built on first add/edit, then reloaded per use
+        self._help_dialog = None # Static content; built on first open and reused
+        self._about_dialog = None
+        self._startup_applied = None # Run-key state last written successfully this session
+        # Insertion-ordered mirror of bl_list: O(1) duplicate checks, and save() reads it
+        # instead of pulling every item back out of the widget
+        self._bl_entries = dict.fromkeys(self.settings.get_blacklist())
+        # Saves and profile edits in quick succession collapse into one hook reload
+        self._reload_timer = QtCore.QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self._reload_hook)
         
         self._init_ui()
 
     def _init_ui(self):
         """Initializes the user interface."""
         self.setWindowTitle('Scroll Lock Settings')
-        self.setWindowIcon(QtGui.QIcon(os.path.join(os.path.dirname(__file__), "..", "mouse.ico")))
+        self.setWindowIcon(window_icon())
         
         # Load geometry or set default
         self.qt_settings = QtCore.QSettings("MetheTech", "WheelScrollFixer")
@@ -40,39 +157,7 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         else:
             self.resize(1300, 750) # Default wide size
 
-        self.setStyleSheet("""
-            QDialog { background-color: #1e1e1e; color: #ffffff; font-family: 'Segoe UI', sans-serif; font-size: 10pt; }
-            QLabel { color: #e0e0e0; }
-            QGroupBox { border: 1px solid #3d3d3d; border-radius: 6px; margin-top: 24px; background-color: #252525; padding-top: 15px; }
-            QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 5px; left: 10px; color: #3a7bd5; font-weight: bold; }
-            
-            /* Sidebar */
-            QListWidget#sidebar { background-color: #2a2a2a; border: none; border-right: 1px solid #333; outline: none; font-size: 12pt; }
-            QListWidget#sidebar::item { padding: 20px; color: #aaaaaa; border-left: 5px solid transparent; margin-bottom: 2px; }
-            QListWidget#sidebar::item:selected { background-color: #333333; color: #ffffff; border-left: 5px solid #3a7bd5; }
-            QListWidget#sidebar::item:hover { background-color: #2d2d2d; }
-
-            /* Buttons */
-            QPushButton { background-color: #3d3d3d; color: #ffffff; border: none; border-radius: 4px; padding: 8px 16px; font-weight: bold; font-size: 10pt; }
-            QPushButton:hover { background-color: #4d4d4d; }
-            QPushButton:pressed { background-color: #2d2d2d; }
-            QPushButton#primary { background-color: #3a7bd5; }
-            QPushButton#primary:hover { background-color: #3a60d5; }
-            QPushButton#danger { background-color: #d32f2f; }
-            
-            /* Inputs */
-            QSpinBox, QDoubleSpinBox, QComboBox, QLineEdit { background-color: #333; border: 1px solid #444; border-radius: 4px; padding: 6px; color: #fff; font-size: 10pt; min-height: 20px; }
-            QComboBox::drop-down { border: none; }
-            
-            /* Checkbox */
-            QCheckBox { spacing: 8px; color: #eee; font-size: 10pt; }
-            QCheckBox::indicator { width: 20px; height: 20px; border: 1px solid #555; border-radius: 3px; background: #333; }
-            QCheckBox::indicator:checked { background-color: #3a7bd5; border-color: #3a7bd5; }
-            
-            /* Scrollbar */
-            QScrollBar:vertical { border: none; background: #1e1e1e; width: 10px; margin: 0; }
-            QScrollBar::handle:vertical { background: #444; min-height: 20px; border-radius: 5px; }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
         self.main_layout = QtWidgets.QHBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -82,11 +167,8 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         self.sidebar = QtWidgets.QListWidget()
         self.sidebar.setObjectName("sidebar")
         self.sidebar.setFixedWidth(450) # FIXED WIDE WIDTH
-        self.sidebar.addItems([
-            "   🎚️  " + translator.tr("tab_sensitivity"), 
-            "   🚀  " + translator.tr("tab_apps"),
-            "   ⚙️  " + translator.tr("tab_general")
-        ])
+        self._page_titles = tuple(translator.tr(key) for _, key in _SIDEBAR_PAGES) # Refreshed by retranslate_ui
+        self.sidebar.addItems([f"   {icon}  {title}" for (icon, _), title in zip(_SIDEBAR_PAGES, self._page_titles)])
         self.sidebar.currentRowChanged.connect(self.change_page)
         self.main_layout.addWidget(self.sidebar)
 
@@ -99,7 +181,7 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         # Header
         self.header_layout = QtWidgets.QHBoxLayout()
         self.page_title = QtWidgets.QLabel("")
-        self.page_title.setStyleSheet("font-size: 22pt; font-weight: bold; color: #fff;")
+        self.page_title.setObjectName("pageTitle")
         
         self.lang_combo = QtWidgets.QComboBox()
         self.lang_combo.addItem("English 🇺🇸", "en")
@@ -119,7 +201,7 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         line = QtWidgets.QFrame()
         line.setFrameShape(QtWidgets.QFrame.HLine)
         line.setFrameShadow(QtWidgets.QFrame.Sunken)
-        line.setStyleSheet("background-color: #333;")
+        line.setObjectName("divider")
         self.content_layout.addWidget(line)
 
         # Stacked Pages
@@ -136,12 +218,16 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         
         self.save_btn = QtWidgets.QPushButton("")
         self.save_btn.setObjectName("primary")
-        self.save_btn.clicked.connect(lambda: self.save(self.configure_startup))
+        self.save_btn.clicked.connect(self._on_save_clicked)
         self.save_btn.setMinimumWidth(150)
         self.save_btn.setMinimumHeight(40)
 
         self.status_label = QtWidgets.QLabel("")
-        self.status_label.setStyleSheet("color: #4caf50; font-weight: bold;")
+        self.status_label.setObjectName("status")
+        # One reusable clear timer; restarting it on each save also debounces rapid saves
+        self._status_clear_timer = QtCore.QTimer(self)
+        self._status_clear_timer.setSingleShot(True)
+        self._status_clear_timer.timeout.connect(self.status_label.clear)
 
         self.footer_layout.addWidget(self.defaults_btn)
         self.footer_layout.addStretch()
@@ -159,15 +245,31 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         self.retranslate_ui()
 
     def _create_widgets_and_pages(self):
-        # --- Page 1: Sensitivity ---
+        # Pages are built on first visit; until then an empty placeholder holds their slot
+        self._page_builders = (self._build_page_sensitivity, self._build_page_apps, self._build_page_general)
+        self._page_setters = {} # row -> [(bound setter, key)] for the pages built so far
+        for _ in self._page_builders:
+            self.pages.addWidget(QtWidgets.QWidget())
+        self._ensure_page(0)
+
+    def _ensure_page(self, row):
+        if row in self._page_setters or not 0 <= row < len(self._page_builders): return
+        placeholder = self.pages.widget(row)
+        self.pages.insertWidget(row, self._page_builders[row]())
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        # Resolve the setters once; language switches then just feed them new strings
+        self._page_setters[row] = [(getattr(getattr(self, attr), setter), key) for attr, setter, key in self._PAGE_TEXTS[row]]
+        self._retranslate_page(row)
+
+    def _build_page_sensitivity(self):
         page_sen = QtWidgets.QWidget()
         layout_sen = QtWidgets.QVBoxLayout(page_sen)
         layout_sen.setAlignment(QtCore.Qt.AlignTop)
         layout_sen.setSpacing(20)
         
         self.calib_btn = QtWidgets.QPushButton("")
-        self.calib_btn.setObjectName("primary")
-        self.calib_btn.setStyleSheet("font-size: 12pt; padding: 15px; background-color: #673AB7;")
+        self.calib_btn.setObjectName("calib")
         self.calib_btn.clicked.connect(self.run_calibration_wizard)
         
         grp_logic = QtWidgets.QGroupBox("")
@@ -212,9 +314,9 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         layout_sen.addWidget(self.calib_btn)
         layout_sen.addWidget(grp_logic)
         layout_sen.addWidget(grp_adv)
-        self.pages.addWidget(page_sen)
+        return page_sen
 
-        # --- Page 2: Apps ---
+    def _build_page_apps(self):
         page_apps = QtWidgets.QWidget()
         layout_apps = QtWidgets.QVBoxLayout(page_apps)
         
@@ -227,7 +329,7 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         # Blacklist
         self.lbl_bl = QtWidgets.QLabel("")
         self.bl_list = QtWidgets.QListWidget()
-        self.bl_list.addItems(self.settings.get_blacklist())
+        self.bl_list.addItems(list(self._bl_entries))
         self.bl_list.setFixedHeight(120)
         
         bl_btns = QtWidgets.QHBoxLayout()
@@ -245,7 +347,6 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         self.lbl_prof = QtWidgets.QLabel("")
         self.prof_list = QtWidgets.QListWidget()
         self.prof_list.setFixedHeight(120)
-        self.refresh_app_profiles_list()
         
         prof_btns = QtWidgets.QHBoxLayout()
         self.btn_prof_add = QtWidgets.QPushButton("")
@@ -268,9 +369,11 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         
         grp_app.setLayout(layout_grp_app)
         layout_apps.addWidget(grp_app)
-        self.pages.addWidget(page_apps)
+        # Built on first visit, so this is also when the profile list is first filled
+        self.refresh_app_profiles_list()
+        return page_apps
 
-        # --- Page 3: General ---
+    def _build_page_general(self):
         page_gen = QtWidgets.QWidget()
         layout_gen = QtWidgets.QVBoxLayout(page_gen)
         layout_gen.setAlignment(QtCore.Qt.AlignTop)
@@ -321,16 +424,17 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         layout_gen.addWidget(grp_sys)
         layout_gen.addSpacing(20)
         layout_gen.addWidget(grp_info)
-        self.pages.addWidget(page_gen)
+        return page_gen
 
     def change_page(self, row):
+        self._ensure_page(row)
         self.pages.setCurrentIndex(row)
-        titles = [translator.tr("tab_sensitivity"), translator.tr("tab_apps"), translator.tr("tab_general")]
-        if row < len(titles):
-            self.page_title.setText(titles[row])
+        if 0 <= row < len(self._page_titles):
+            self.page_title.setText(self._page_titles[row])
 
     def change_language(self):
         lang_code = self.lang_combo.currentData()
+        if lang_code == translator.get_language(): return # Nothing to retranslate
         translator.set_language(lang_code)
         self.settings.set_language(lang_code)
         self.retranslate_ui()
@@ -341,79 +445,73 @@ class ModernSettingsDialog(QtWidgets.QDialog):
         tr = translator.tr
         self.setWindowTitle(tr("window_title"))
         
-        # Sidebar items
-        self.sidebar.item(0).setText("   🎚️  " + tr("tab_sensitivity"))
-        self.sidebar.item(1).setText("   🚀  " + tr("tab_apps"))
-        self.sidebar.item(2).setText("   ⚙️  " + tr("tab_general"))
+        # Sidebar items; the titles are kept for change_page
+        self._page_titles = tuple(tr(key) for _, key in _SIDEBAR_PAGES)
+        self.sidebar.blockSignals(True)
+        for row, ((icon, _), title) in enumerate(zip(_SIDEBAR_PAGES, self._page_titles)):
+            self.sidebar.item(row).setText(f"   {icon}  {title}")
+        self.sidebar.blockSignals(False)
         
         # Page Title update
-        current_titles = [tr("tab_sensitivity"), tr("tab_apps"), tr("tab_general")]
-        self.page_title.setText(current_titles[self.pages.currentIndex()])
-
-        # --- Page 1: Sensitivity ---
-        self.calib_btn.setText("  " + tr("btn_calibration") + "  ")
-        self.grp_logic.setTitle(tr("grp_blocking"))
-        self.interval_lbl.setText(tr("lbl_interval"))
-        self.interval_spin.setToolTip(tr("tip_interval"))
-        self.threshold_lbl.setText(tr("lbl_threshold"))
-        self.threshold_spin.setToolTip(tr("tip_threshold"))
-        self.reversal_lbl.setText(tr("lbl_min_reversal"))
-        self.reversal_spin.setToolTip(tr("tip_min_reversal"))
-        self.grp_adv.setTitle(tr("grp_adv_features"))
-        self.strict_cb.setText(tr("chk_strict"))
-        self.strict_cb.setToolTip(tr("tip_strict"))
-        self.smart_cb.setText(tr("chk_smart"))
-        self.smart_cb.setToolTip(tr("tip_smart"))
-        
-        # --- Page 2: Apps ---
-        self.grp_app.setTitle(tr("grp_app_control"))
-        self.lbl_bl.setText(tr("lbl_blacklist"))
-        self.btn_bl_add.setText(tr("btn_add_current"))
-        self.btn_bl_rem.setText(tr("btn_remove_selected"))
-        self.btn_bl_clr.setText(tr("btn_clear_all"))
-        self.lbl_prof.setText(tr("lbl_profiles"))
-        self.btn_prof_add.setText(tr("btn_add_profile"))
-        self.btn_prof_edit.setText(tr("btn_edit_profile"))
-        self.btn_prof_rem.setText(tr("btn_remove_profile"))
-
-        # --- Page 3: General ---
-        self.grp_sys.setTitle(tr("grp_system"))
-        self.enabled_cb.setText(tr("chk_enable"))
-        self.enabled_cb.setToolTip(tr("tip_enable"))
-        self.start_cb.setText(tr("chk_start_boot"))
-        self.start_cb.setToolTip(tr("tip_start_boot"))
-        self.font_lbl.setText(tr("lbl_font_size"))
-        self.grp_info.setTitle(tr("grp_info"))
-        self.btn_web.setText(tr("btn_website"))
-        self.btn_help.setText(tr("tray_help"))
-        self.btn_about.setText(tr("tray_about"))
-        
+        self.page_title.setText(self._page_titles[self.pages.currentIndex()])
+
+        # Pages not built yet pick up the current language when they are first shown
+        for row in self._page_setters:
+            self._retranslate_page(row)
+
         # Footer
         self.defaults_btn.setText(tr("btn_defaults"))
         self.save_btn.setText(tr("btn_save"))
 
+    def _retranslate_page(self, row):
+        tr = translator.tr
+        for set_text, key in self._page_setters[row]:
+            set_text(tr(key))
+
     # --- Logic Methods ---
+    @QtCore.pyqtSlot()
+    def _on_save_clicked(self):
+        self.save(self.configure_startup)
+
     def save(self, configure_startup):
         self.settings.set_interval(self.interval_spin.value())
-        bl = [self.bl_list.item(i).text() for i in range(self.bl_list.count())]
-        self.settings.set_blacklist(bl)
-        self.settings.set_startup(self.start_cb.isChecked())
-        configure_startup(self.start_cb.isChecked())
-        self.settings.set_enabled(self.enabled_cb.isChecked())
+        bl = list(self._bl_entries)
+        # Lists always count as changed in set_value, so only write a blacklist that differs
+        if bl != self.settings.get_blacklist():
+            self.settings.set_blacklist(bl)
+        # An unvisited General page has no widgets yet; its stored values stand
+        general = 2 in self._page_setters
+        startup = self.start_cb.isChecked() if general else self.settings.get_startup()
+        self.settings.set_startup(startup)
+        # The Run key only needs rewriting when it changes (or a previous write failed)
+        if startup != self._startup_applied and configure_startup(startup):
+            self._startup_applied = startup
+        if general:
+            self.settings.set_enabled(self.enabled_cb.isChecked())
         self.settings.set_direction_change_threshold(self.threshold_spin.value())
         self.settings.set_strict_mode(self.strict_cb.isChecked())
         self.settings.set_min_reversal_interval(self.reversal_spin.value())
         self.settings.set_smart_momentum(self.smart_cb.isChecked())
-        self.settings.set_font_size(self.font_spin.value())
-        self.settings.sync()
-        self.hook.reload_settings(self.update_tray_icon_callback, self.update_font_callback)
-        self.apply_settings()
+        # Re-fonting the whole app is a full style pass, so only do it when the size moved
+        font_size = self.font_spin.value() if general else self.settings.get_font_size()
+        font_changed = font_size != self.settings.get_font_size()
+        self.settings.set_font_size(font_size)
+        self.settings.request_sync()
+        self._reload_timer.start()
+        if font_changed:
+            self.apply_settings()
         self.status_label.setText(translator.tr("status_saved"))
-        QtCore.QTimer.singleShot(3000, lambda: self.status_label.setText(""))
+        self._status_clear_timer.start(3000)
+
+    @QtCore.pyqtSlot()
+    def _reload_hook(self):
+        self.hook.reload_settings(self.update_tray_icon_callback)
 
+    @QtCore.pyqtSlot()
     def restore_defaults(self):
         reply = QtWidgets.QMessageBox.question(self, translator.tr("msg_reset_title"), translator.tr("msg_reset_text"), QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         if reply == QtWidgets.QMessageBox.Yes:
+            self._ensure_page(2) # enabled_cb lives on the General page
             self.interval_spin.setValue(0.30)
             self.threshold_spin.setValue(2)
             self.strict_cb.setChecked(True)
@@ -425,77 +523,139 @@ class ModernSettingsDialog(QtWidgets.QDialog):
             self.status_label.setText(translator.tr("status_restored"))
 
     def refresh_app_profiles_list(self):
-        self.prof_list.clear()
-        for app_name, profile in self.settings.get_app_profiles().items():
-            interval = profile.get('interval', self.settings.get_interval())
-            threshold = profile.get('threshold', self.settings.get_direction_change_threshold())
-            self.prof_list.addItem(f"{app_name}: Interval={interval:.2f}s, Threshold={threshold}")
-
+        default_interval = self.settings.get_interval()
+        default_threshold = self.settings.get_direction_change_threshold()
+        # Repopulate with updates and selection signals suspended so the list repaints once
+        lw = self.prof_list
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            lw.clear()
+            for app_name, profile in self.settings.get_app_profiles().items():
+                item = QtWidgets.QListWidgetItem(
+                    f"{app_name}: Interval={profile.get('interval', default_interval):.2f}s, "
+                    f"Threshold={profile.get('threshold', default_threshold)}"
+                )
+                item.setData(QtCore.Qt.UserRole, app_name) # Profile key, so selections needn't parse the label
+                lw.addItem(item)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+
+    def _get_profile_dialog(self, app_name=None, interval=0.3, threshold=2):
+        if self._profile_dialog is None:
+            self._profile_dialog = AppProfileDialog(parent=self)
+        self._profile_dialog.load(app_name, interval, threshold)
+        return self._profile_dialog
+
+    @QtCore.pyqtSlot()
     def add_app_profile(self):
-        dialog = AppProfileDialog(parent=self)
+        dialog = self._get_profile_dialog()
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             data = dialog.get_profile_data()
             app_name = data['app_name'].lower()
             if not app_name: return
             profiles = self.settings.get_app_profiles()
-            profiles[app_name] = {'interval': data['interval'], 'threshold': data['threshold']}
+            profile = {'interval': data['interval'], 'threshold': data['threshold']}
+            if profiles.get(app_name) == profile: return # Nothing for the hook to rebuild
+            profiles[app_name] = profile
             self.settings.set_app_profiles(profiles)
             self.refresh_app_profiles_list()
-            self.hook.reload_settings(self.update_tray_icon_callback, self.update_font_callback)
+            self._reload_timer.start()
 
+    @QtCore.pyqtSlot()
     def edit_app_profile(self):
         sel = self.prof_list.selectedItems()
         if not sel: return
-        item_text = sel[0].text()
-        app_name_raw = item_text.split(':')[0].strip()
-        app_name = app_name_raw.lower()
+        app_name = sel[0].data(QtCore.Qt.UserRole)
         profiles = self.settings.get_app_profiles()
         profile_data = profiles.get(app_name, {})
-        dialog = AppProfileDialog(current_app_name=app_name_raw, current_interval=profile_data.get('interval', 0.3), current_threshold=profile_data.get('threshold', 2), parent=self)
+        dialog = self._get_profile_dialog(app_name, profile_data.get('interval', 0.3), profile_data.get('threshold', 2))
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             data = dialog.get_profile_data()
             new_app_name = data['app_name'].lower()
             if not new_app_name: return
-            if new_app_name != app_name: del profiles[app_name]
-            profiles[new_app_name] = {'interval': data['interval'], 'threshold': data['threshold']}
+            profile = {'interval': data['interval'], 'threshold': data['threshold']}
+            if new_app_name == app_name and profiles.get(app_name) == profile: return # Unchanged
+            if new_app_name != app_name: profiles.pop(app_name, None)
+            profiles[new_app_name] = profile
             self.settings.set_app_profiles(profiles)
             self.refresh_app_profiles_list()
-            self.hook.reload_settings(self.update_tray_icon_callback, self.update_font_callback)
+            self._reload_timer.start()
 
+    @QtCore.pyqtSlot()
     def remove_app_profile(self):
         sel = self.prof_list.selectedItems()
         if not sel: return
         if QtWidgets.QMessageBox.question(self, translator.tr("msg_input_error"), translator.tr("msg_confirm_removal"), QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No) == QtWidgets.QMessageBox.Yes:
             profiles = self.settings.get_app_profiles()
             for item in sel:
-                app = item.text().split(':')[0].strip().lower()
-                if app in profiles: del profiles[app]
+                profiles.pop(item.data(QtCore.Qt.UserRole), None)
             self.settings.set_app_profiles(profiles)
             self.refresh_app_profiles_list()
-            self.hook.reload_settings(self.update_tray_icon_callback, self.update_font_callback)
+            self._reload_timer.start()
 
+    @QtCore.pyqtSlot()
     def add_current_app_to_blacklist(self):
+        # Clicks queued before the hide takes effect would each schedule another lookup
+        if self._fg_pick_pending: return
+        self._fg_pick_pending = True
         self.hide()
-        QtCore.QTimer.singleShot(120, self._get_and_add_foreground_app)
-
-    def _get_and_add_foreground_app(self):
-        proc_name = get_foreground_process_name()
-        existing = [self.bl_list.item(i).text() for i in range(self.bl_list.count())]
-        if proc_name and proc_name not in existing: self.bl_list.addItem(proc_name)
+        # The delay only lets focus pass to the previous window; the Win32 lookup runs off-thread
+        QtCore.QTimer.singleShot(120, self._start_foreground_lookup)
+
+    @QtCore.pyqtSlot()
+    def _start_foreground_lookup(self):
+        QtCore.QThreadPool.globalInstance().start(_ForegroundLookup(self._fg_signals))
+
+    @QtCore.pyqtSlot(str)
+    def _on_foreground_app(self, proc_name):
+        self._fg_pick_pending = False
+        if proc_name and proc_name not in self._bl_entries:
+            self._bl_entries[proc_name] = None
+            self.bl_list.addItem(proc_name)
         self.show()
 
+    @QtCore.pyqtSlot()
     def remove_selected_from_blacklist(self):
-        for item in self.bl_list.selectedItems(): self.bl_list.takeItem(self.bl_list.row(item))
-
+        lw = self.bl_list
+        # Remove by row, highest first, so earlier rows keep their indices (row(item) is a linear scan)
+        rows = sorted({idx.row() for idx in lw.selectedIndexes()}, reverse=True)
+        if not rows: return
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            for r in rows:
+                item = lw.takeItem(r)
+                self._bl_entries.pop(item.text(), None)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+
+    @QtCore.pyqtSlot()
     def clear_blacklist(self):
         self.bl_list.clear()
+        self._bl_entries.clear()
 
+    @QtCore.pyqtSlot()
     def open_website(self): QtGui.QDesktopServices.openUrl(QtCore.QUrl("https://en.MetheTech.com"))
-    def show_help_dialog(self): HelpDialog(self).exec_()
-    def show_about_dialog(self): AboutDialog(self).exec_()
+    @QtCore.pyqtSlot()
+    def show_help_dialog(self):
+        if self._help_dialog is None:
+            from .help_dialog import HelpDialog
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec_()
+    @QtCore.pyqtSlot()
+    def show_about_dialog(self):
+        if self._about_dialog is None:
+            from .about_dialog import AboutDialog
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
     def apply_settings(self): self.update_font_callback()
     
+    @QtCore.pyqtSlot()
     def run_calibration_wizard(self):
+        from .calibration_wizard import CalibrationWizardDialog
         wizard = CalibrationWizardDialog(self)
         self.hook.set_calibration_callback(wizard.process_scroll_event)
         result = wizard.exec_()
@@ -513,7 +673,10 @@ class ModernSettingsDialog(QtWidgets.QDialog):
 
     def minimize_to_tray(self): self.hide()
     def closeEvent(self, event): 
-        self.qt_settings.setValue("geometry", self.saveGeometry())
+        geometry = self.saveGeometry()
+        # Open-and-close without moving or resizing leaves nothing to write back
+        if self.qt_settings.value("geometry") != geometry:
+            self.qt_settings.setValue("geometry", geometry)
         self.hide()
         event.ignore()
 
@@ -97,6 +97,7 @@ TRANSLATIONS = {
         "calib_diag_stop_bounce": "Stop bounce detected (worst latency: {worst_ms}ms). Interval adjusted.",
         "calib_diag_no_bounce": "No bounce-back detected on stop. Clean mechanicals.",
         "calib_diag_optimized_interval": "Interval adjusted.",
+        "calib_diag_analysis_failed": "The recording could not be analysed. Default settings are shown.",
         "calib_diag_optimized_threshold": "Threshold adjusted.",
         "calib_diag_optimized_strict": "Strict Mode enabled.",
         "calib_diag_optimized_physics": "Physics check optimized.",
@@ -203,6 +204,7 @@ TRANSLATIONS = {
         "calib_diag_stop_bounce": "Duruşta sıçrama tespit edildi (en kötü gecikme: {worst_ms}ms). Aralık ayarlandı.",
         "calib_diag_no_bounce": "Duruşta sıçrama tespit edilmedi. Temiz mekanik.",
         "calib_diag_optimized_interval": "Aralık ayarlandı.",
+        "calib_diag_analysis_failed": "Kayıt analiz edilemedi. Varsayılan ayarlar gösteriliyor.",
         "calib_diag_optimized_threshold": "Eşik ayarlandı.",
         "calib_diag_optimized_strict": "Katı Mod etkinleştirildi.",
         "calib_diag_optimized_physics": "Fizik kontrolü optimize edildi.",
@@ -223,19 +225,20 @@ class Translator:
         if cls._instance is None:
             cls._instance = super(Translator, cls).__new__(cls)
             cls._instance.language = "en"
+            cls._instance._strings = TRANSLATIONS["en"] # Active language table, resolved once per switch
         return cls._instance
 
     def set_language(self, lang_code):
         if lang_code in TRANSLATIONS:
             self.language = lang_code
+            self._strings = TRANSLATIONS[lang_code]
 
     def get_language(self):
         return self.language
 
     def tr(self, key, **kwargs):
         """Returns the translated string for the given key, with optional formatting."""
-        lang_dict = TRANSLATIONS.get(self.language, TRANSLATIONS["en"])
-        translated_text = lang_dict.get(key, key)
-        return translated_text.format(**kwargs)
+        translated_text = self._strings.get(key, key)
+        return translated_text.format(**kwargs) if kwargs else translated_text
 
 translator = Translator() # Global instance
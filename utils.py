@@ -1,15 +1,81 @@
-import psutil
+import os
+import time
+import ctypes
+from ctypes import wintypes
 import win32gui
 import win32process
 
-def get_foreground_process_name():
-    """Returns the name of the process associated with the foreground window."""
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_OpenProcess = _kernel32.OpenProcess
+_OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_OpenProcess.restype = wintypes.HANDLE
+_QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+_QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)]
+_QueryFullProcessImageNameW.restype = wintypes.BOOL
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+_GetProcessTimes = _kernel32.GetProcessTimes
+_GetProcessTimes.argtypes = [wintypes.HANDLE] + [ctypes.POINTER(wintypes.FILETIME)] * 4
+_GetProcessTimes.restype = wintypes.BOOL
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+# (pid, creation FILETIME) -> executable name; the creation time tells a reused pid apart
+# from the process that held it before. Cleared wholesale once it grows past _PID_CACHE_MAX
+_pid_name_cache = {}
+_PID_CACHE_MAX = 256
+
+# Foreground window -> process name memo, shared by the hook thread and pool workers.
+# One immutable (hwnd, ts_ns, name) tuple replaced in a single assignment, so a reader
+# never pairs one lookup's hwnd with another's name.
+_fg_cache = (0, 0, None)
+_TTL_NS = 250_000_000
+
+def _proc_name(pid):
+    """Returns the executable name for pid via QueryFullProcessImageNameW, cached per process instance."""
+    handle = _OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
     try:
-        hwnd = win32gui.GetForegroundWindow()
-        if not hwnd:
+        created, exited, kernel, user = (wintypes.FILETIME() for _ in range(4))
+        if not _GetProcessTimes(handle, ctypes.byref(created), ctypes.byref(exited),
+                                ctypes.byref(kernel), ctypes.byref(user)):
             return None
-        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        proc = psutil.Process(pid)
-        return proc.name()
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        key = (pid, created.dwHighDateTime << 32 | created.dwLowDateTime)
+        name = _pid_name_cache.get(key)
+        if name is not None:
+            return name
+        buf = ctypes.create_unicode_buffer(260)
+        size = wintypes.DWORD(len(buf))
+        if not _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return None
+    finally:
+        _CloseHandle(handle)
+    name = os.path.basename(buf.value)
+    if len(_pid_name_cache) >= _PID_CACHE_MAX:
+        _pid_name_cache.clear()
+    _pid_name_cache[key] = name
+    return name
+
+def get_window_process_name(hwnd):
+    """Returns the name of the process that owns the given window handle."""
+    if not hwnd:
         return None
+    _, pid = win32process.GetWindowThreadProcessId(hwnd)
+    return _proc_name(pid) if pid else None
+
+def get_foreground_process_name():
+    """
+    Returns the name of the process associated with the foreground window.
+    The result is memoized per window handle for _TTL_NS, so repeated calls while the
+    same window stays in front cost a single GetForegroundWindow call.
+    """
+    global _fg_cache
+    hwnd = win32gui.GetForegroundWindow()
+    now = time.perf_counter_ns()
+    cached_hwnd, cached_ns, cached_name = _fg_cache
+    if hwnd == cached_hwnd and now - cached_ns < _TTL_NS:
+        return cached_name
+    name = get_window_process_name(hwnd)
+    _fg_cache = (hwnd, now, name)
+    return name